@@ -1,53 +1,66 @@
+import copy
 import os
-from pathlib import Path
+import time
+
+# Taken before the PyQt imports so the startup report can account for them
+PROCESS_START = time.perf_counter()
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QScrollArea, QDialog,
-    QLabel, QLineEdit, QDateEdit, QHBoxLayout, QFormLayout, QMessageBox, QListWidget, QListWidgetItem,
-    QSystemTrayIcon, QMenu, QColorDialog, QGroupBox, QCheckBox, QSpinBox, QTabWidget, QComboBox, QTextEdit, QDialogButtonBox, QFileDialog
+    QLabel, QLineEdit, QDateEdit, QHBoxLayout, QFormLayout, QMessageBox,
+    QSystemTrayIcon, QMenu, QColorDialog, QGroupBox, QCheckBox, QSpinBox, QTabWidget, QComboBox, QTextEdit, QDialogButtonBox, QFileDialog,
+    QListView, QStyledItemDelegate, QStyle, QProgressBar, QInputDialog, QProgressDialog
 )
-from PyQt6.QtCore import QDate, Qt
-from PyQt6.QtGui import QIcon, QPixmap, QColor, QPainter, QDoubleValidator
-from PyQt6.QtCharts import (
-    QChartView, QChart, QValueAxis, QBarSeries, QBarSet, QBarCategoryAxis
+from PyQt6.QtCore import (
+    QDate, Qt, QAbstractItemModel, QAbstractListModel, QSortFilterProxyModel, QModelIndex, QSize, QRect, QRectF, QPoint, QEvent, QObject, QRunnable, QThreadPool,
+    QTimer, QDateTime, QPointF, pyqtSignal
 )
+from PyQt6.QtGui import QIcon, QPixmap, QImage, QColor, QPainter, QDoubleValidator, QFont, QLinearGradient
 import json
+import sqlite3
+import numpy as np
 import sys
+from collections import OrderedDict
+
+from subscription_budget import BudgetMonitor
+from subscription_catalog import get_catalog
+from subscription_analytics import AnalyticsRequest, compute_analytics
+from subscription_core import LOGO_DIR, DEFAULT_ICON, Subscription, SubscriptionStore, month_index, today_ordinal
+from subscription_export import EXPORT_FORMATS, ExportCancelled, export_subscriptions
+from subscription_logos import LogoAtlas
+from subscription_query import QueryError, parse_query
+from subscription_recurrence import BILLING_FREQUENCIES, period_label, roll_forward
+from subscription_reminders import day_start
+from subscription_storage import STORAGE_BACKENDS, WriteBehindWriter, create_backend
 
 
-LOGO_DIR = Path("logos")
 LOGO_DIR.mkdir(exist_ok=True)
-DEFAULT_ICON = str(LOGO_DIR / "default_logo.png")
-
-
-
-PREDEFINED_SUBSCRIPTIONS = [
-    {"name": "Netflix", "color": "#E50914", "logo": str(LOGO_DIR / "netflix.png")},
-    {"name": "Spotify", "color": "#1DB954", "logo": str(LOGO_DIR / "spotify.png")},
-    {"name": "Amazon Prime", "color": "#00A8E1", "logo": str(LOGO_DIR / "amazon_prime.png")},
-    {"name": "Disney+", "color": "#113CCF", "logo": str(LOGO_DIR / "disney_plus.png")},
-    {"name": "Slack", "color": "#4A154B", "logo": str(LOGO_DIR / "slack.png")},
-    {"name": "LinkedIn Premium", "color": "#0077B5", "logo": str(LOGO_DIR / "linkedin_premium.png")},
-    {"name": "YouTube Premium", "color": "#FF0000", "logo": str(LOGO_DIR / "youtube.png")},
-    {"name": "HBO Max", "color": "#8400FF", "logo": str(LOGO_DIR / "hbo.png")},
-    {"name": "Apple TV+", "color": "#000000", "logo": str(LOGO_DIR / "appletv.png")},
-    {"name": "Xbox Game Pass", "color": "#107C10", "logo": str(LOGO_DIR / "xbox.png")},
-    {"name": "PlayStation Plus", "color": "#003791", "logo": str(LOGO_DIR / "playstation.png")},
-    {"name": "Apple Music", "color": "#FC3C44", "logo": str(LOGO_DIR / "applemusic.png")},
-    {"name": "Adobe Creative Cloud", "color": "#FF0000", "logo": str(LOGO_DIR / "adobe.png")},
-    {"name": "Microsoft 365", "color": "#0078D4", "logo": str(LOGO_DIR / "office365.png")},
-    {"name": "Google One", "color": "#4285F4", "logo": str(LOGO_DIR / "googleone.png")},
-    {"name": "Dropbox", "color": "#0061FF", "logo": str(LOGO_DIR / "dropbox.png")},
-    {"name": "iCloud+", "color": "#147EFB", "logo": str(LOGO_DIR / "icloud.png")},
-    {"name": "Hulu", "color": "#1CE783", "logo": str(LOGO_DIR / "hulu.png")},
-    {"name": "EA Play", "color": "#FF4747", "logo": str(LOGO_DIR / "eaplay.png")},
-    {"name": "Paramount+", "color": "#0064FF", "logo": str(LOGO_DIR / "paramount.png")},
-    {"name": "Discord Nitro", "color": "#5865F2", "logo": str(LOGO_DIR / "discord.png")},
-    {"name": "GitHub Pro", "color": "#24292E", "logo": str(LOGO_DIR / "github.png")},
-    {"name": "Nord VPN", "color": "#4687FF", "logo": str(LOGO_DIR / "nordvpn.png")},
-    {"name": "Twitch Prime", "color": "#9146FF", "logo": str(LOGO_DIR / "twitch.png")},
-    {"name": "Crunchyroll", "color": "#F47521", "logo": str(LOGO_DIR / "crunchyroll.png")},
-    {"name": "Amazon Music", "color": "#00A8E1", "logo": str(LOGO_DIR / "amazonmusic.png")}
-]
+
+
+class StartupTimer:
+    """Records where launch time goes; printed when run with ``--startup-timing``."""
+
+    def __init__(self, start, enabled=False):
+        self.start = start
+        self.enabled = enabled
+        self.marks = {}
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter()
+
+    def report(self):
+        previous = self.start
+        lines = ["Startup timing:"]
+        for name, stamp in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"  {name:<22}{(stamp - previous) * 1000:8.1f} ms  (at {(stamp - self.start) * 1000:8.1f} ms)")
+            previous = stamp
+        return "\n".join(lines)
+
+startup_timer = StartupTimer(PROCESS_START, enabled="--startup-timing" in sys.argv)
+startup_timer.mark("imports")
+
+
 
 MODERN_COLORS = {
     "background": "#1A1A1A",     
@@ -74,10 +87,6 @@ CURRENCIES = [
     {"symbol": "¥", "code": "JPY", "name": "Japanese Yen"}
 ]
 
-BILLING_FREQUENCIES = [
-    "Monthly", "Quarterly", "Semi-Annually", "Annually"
-]
-
 LIGHT_COLORS = {
     "background": "#FFFFFF",
     "card": "#F5F5F5",
@@ -91,187 +100,736 @@ LIGHT_COLORS = {
     "button_hover": "#D0D0D0"
 }
 
-class SubscriptionCard(QWidget):
-    def __init__(self, name, renewal_date, cost, color, logo, category, on_edit, on_delete, parent=None):
-        super().__init__(parent)
-        self.name = name
-        self.renewal_date = renewal_date
-        self.cost = str(float(cost))
-        self.color = color
-        self.logo = logo if os.path.exists(logo) else DEFAULT_ICON
-        self.category = category
+DARK_COLORS = {
+    "background": "#2C3E50",
+    "card": "#34495E",
+    "card_hover": "#3D566E",
+    "text_primary": "#ECF0F1",
+    "text_secondary": "#BDC3C7",
+    "accent": "#4F46E5",
+    "accent_hover": "#4338CA",
+    "border": "#415B76",
+    "button": "#415B76",
+    "button_hover": "#4A6785"
+}
 
-        
-        self.setFixedSize(390, 120)
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        self.container = QWidget()
-        self.container.setObjectName("card")
-        
-        
-        container_layout = QHBoxLayout(self.container)
-        container_layout.setContentsMargins(16, 8, 16, 16)
-        container_layout.setSpacing(8)
+THEMES = {
+    "modern": MODERN_COLORS,
+    "light": LIGHT_COLORS,
+    "dark": DARK_COLORS
+}
 
-        
-        content_widget = QWidget()
-        content_layout = QHBoxLayout(content_widget)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        
-        
-        logo_label = QLabel()
-        pixmap = QPixmap(self.logo)
-        if pixmap.isNull():
-            pixmap = QPixmap(DEFAULT_ICON)
-        scaled_pixmap = pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, 
-                                    Qt.TransformationMode.SmoothTransformation)
-        logo_label.setPixmap(scaled_pixmap)
-        logo_label.setFixedSize(48, 48)
-        
-        
-        details_widget = QWidget()
-        details_layout = QVBoxLayout(details_widget)
-        details_layout.setContentsMargins(8, 0, 0, 0)
-        details_layout.setSpacing(4)
-
-        self.name_label = QLabel(name)
-        self.name_label.setWordWrap(True)
-        self.date_label = QLabel(f"Renewal: {renewal_date}")
-        self.cost_label = QLabel(f"${float(cost):.2f}/month")
-        
-        details_layout.addWidget(self.name_label)
-        details_layout.addWidget(self.date_label)
-        details_layout.addWidget(self.cost_label)
-        
-        content_layout.addWidget(logo_label)
-        content_layout.addWidget(details_widget, 1)
-        
-        
-        buttons_widget = QWidget()
-        buttons_layout = QVBoxLayout(buttons_widget)
-        buttons_layout.setContentsMargins(0, 0, 0, 0)
-        buttons_layout.setSpacing(16)
-        
-       
-        edit_button = QPushButton("⋮")
-        edit_button.setFixedSize(32, 32)
-        edit_button.setStyleSheet(f"""
+STATUS_COLORS = {
+    "green": "#2ECC71",
+    "yellow": "#F1C40F",
+    "orange": "#E67E22",
+    "red": "#E74C3C"
+}
+
+_theme_stylesheets = {}
+
+def theme_stylesheet(theme):
+    """Return the application-wide stylesheet for a theme, built once per theme.
+
+    Per-widget state is expressed through dynamic properties (for example
+    ``status="red"``) so changing it only needs a re-polish, not a new sheet.
+    """
+    sheet = _theme_stylesheets.get(theme)
+    if sheet is None:
+        colors = THEMES.get(theme, LIGHT_COLORS)
+        status_rules = "".join(
+            f"""
+            QLabel[status="{status}"] {{
+                color: {color};
+            }}
+            QProgressBar#budgetGauge[status="{status}"]::chunk {{
+                background-color: {color};
+            }}"""
+            for status, color in STATUS_COLORS.items()
+        )
+        sheet = f"""
+            QMainWindow, QDialog {{
+                background-color: {colors["background"]};
+                color: {colors["text_primary"]};
+            }}
+            QLabel {{
+                color: {colors["text_primary"]};
+            }}
             QPushButton {{
-                background-color: {MODERN_COLORS["button"]};
-                color: {MODERN_COLORS["text_primary"]};
+                background-color: {colors["button"]};
+                color: {colors["text_primary"]};
                 border: none;
-                border-radius: 16px;
-                font-size: 18px;
+                padding: 5px;
+                border-radius: 3px;
             }}
             QPushButton:hover {{
-                background-color: {MODERN_COLORS["button_hover"]};
-            }}
-        """)
-        
-        
-        self.status_indicator = QPushButton()
-        self.status_indicator.setFixedSize(24, 24)
-        self.status_indicator.clicked.connect(self.show_days_to_renewal)
-        
-       
-        buttons_layout.addWidget(edit_button, 0, Qt.AlignmentFlag.AlignTop)
-        buttons_layout.addStretch()
-        buttons_layout.addWidget(self.status_indicator, 0, Qt.AlignmentFlag.AlignBottom)
-        
-        
-        container_layout.addWidget(content_widget)
-        container_layout.addWidget(buttons_widget, 0, Qt.AlignmentFlag.AlignRight)
-        
-       
-        separator = QWidget()
-        separator.setFixedHeight(2)
-        separator.setStyleSheet(f"""
-            QWidget {{
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 transparent,
-                    stop:0.2 {MODERN_COLORS["border"]},
-                    stop:0.8 {MODERN_COLORS["border"]},
-                    stop:1 transparent
-                );
-                margin-top: 8px;
-                margin-bottom: 8px;
+                background-color: {colors["button_hover"]};
             }}
-        """)
-        
-        
-        container_layout.addWidget(separator)
-        container_layout.setStretch(0, 1)  # Make separator expand horizontally
-        
-        main_layout.addWidget(self.container)
-        
-       
-        menu = QMenu()
-        menu.setStyleSheet(f"""
             QMenu {{
-                background-color: {MODERN_COLORS["card"]};
-                border: 1px solid {MODERN_COLORS["border"]};
+                background-color: {colors["card"]};
+                border: 1px solid {colors["border"]};
                 border-radius: 4px;
                 padding: 4px;
             }}
             QMenu::item {{
-                color: {MODERN_COLORS["text_primary"]};
+                color: {colors["text_primary"]};
                 padding: 8px 16px;
             }}
             QMenu::item:selected {{
-                background-color: {MODERN_COLORS["button_hover"]};
+                background-color: {colors["button_hover"]};
             }}
-        """)
-        
-        edit_action = menu.addAction("Edit")
-        delete_action = menu.addAction("Delete")
-        edit_action.triggered.connect(lambda: on_edit(self))
-        delete_action.triggered.connect(lambda: on_delete(self))
-        edit_button.clicked.connect(lambda: menu.exec(edit_button.mapToGlobal(
-            edit_button.rect().bottomRight())))
-        
-        self.update_status_indicator()
+            QLabel#totalCostLabel {{
+                font-size: 16px;
+                font-weight: bold;
+            }}
+            QLabel#notificationStatus {{
+                padding: 5px;
+            }}
+            QLineEdit[invalid="true"] {{
+                border: 1px solid {STATUS_COLORS["red"]};
+            }}{status_rules}
+        """
+        _theme_stylesheets[theme] = sheet
+    return sheet
 
-    def show_days_to_renewal(self):
-        days = QDate.currentDate().daysTo(QDate.fromString(self.renewal_date, "yyyy-MM-dd"))
-        QMessageBox.information(self, "Days to Renewal", 
-            f"Days until renewal: {days}\nRenewal date: {self.renewal_date}")
+def set_style_property(widget, name, value):
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
 
-    def update_status_indicator(self):
-        days = QDate.currentDate().daysTo(QDate.fromString(self.renewal_date, "yyyy-MM-dd"))
-        
-        if days > 15:
-            color = "#2ECC71"  # Green
-        elif 8 <= days <= 15:
-            color = "#F1C40F"  # Yellow
-        elif 3 <= days < 8:
-            color = "#E67E22"  # Orange
+# Bars shown before the rest of a selection is folded into "Other"
+CHART_TOP_N = 10
+# Charts drawing more items than this skip animations
+CHART_ANIMATION_LIMIT = 200
+
+def set_chart_animation(chart, size):
+    from PyQt6.QtCharts import QChart
+
+    chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations if size <= CHART_ANIMATION_LIMIT
+                              else QChart.AnimationOption.NoAnimation)
+
+CARD_LOGO_SIZE = 48
+LIST_ICON_SIZE = 16
+TRAY_ICON_SIZE = 64
+
+def decode_logo_image(path, size):
+    """Decode and scale a logo into a QImage; safe to call off the GUI thread."""
+    image = QImage(path)
+    if image.isNull():
+        image = QImage(DEFAULT_ICON)
+    return image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation)
+
+class LogoLoader(QRunnable):
+    def __init__(self, cache, path, size):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.cache = cache
+        self.path = path
+        self.size = size
+
+    def run(self):
+        self.cache.image_decoded.emit(self.path, self.size, decode_logo_image(self.path, self.size))
+
+class LogoCache(QObject):
+    """Process-wide cache of decoded, pre-scaled logos keyed by (path, size).
+
+    Entries are evicted least-recently-used first once the decoded pixel
+    data exceeds ``max_bytes``. ``pixmap`` decodes synchronously for the
+    handful of icons dialogs need; ``request`` decodes on a thread pool and
+    emits ``logo_ready`` once the pixmap is cached. Logos covered by the
+    packed atlas are copied straight out of it and never hit the pool.
+    """
+    image_decoded = pyqtSignal(str, int, QImage)
+    logo_ready = pyqtSignal(str, int)
+
+    VISIBLE_PRIORITY = 1
+    PREFETCH_PRIORITY = 0
+
+    def __init__(self, max_bytes=16 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self.pool = QThreadPool(self)
+        self.atlas = LogoAtlas.open()
+        self.image_decoded.connect(self._store_image)
+
+    def pixmap(self, path, size):
+        pixmap = self.cached_pixmap(path, size)
+        if pixmap is None:
+            pixmap = self._insert((path, size), QPixmap.fromImage(decode_logo_image(path, size)))
+        return pixmap
+
+    def cached_pixmap(self, path, size):
+        key = (path, size)
+        pixmap = self._entries.get(key)
+        if pixmap is not None:
+            self._entries.move_to_end(key)
+            return pixmap
+        return self._atlas_pixmap(key)
+
+    def _atlas_pixmap(self, key):
+        found = self.atlas.lookup(*key) if self.atlas is not None else None
+        if found is None:
+            return None
+        pixels, width, height = found
+        image = QImage(pixels, width, height, width * 4, QImage.Format.Format_ARGB32_Premultiplied)
+        return self._insert(key, QPixmap.fromImage(image))
+
+    def icon(self, path, size):
+        return QIcon(self.pixmap(path, size))
+
+    def request(self, path, size, priority=PREFETCH_PRIORITY):
+        key = (path, size)
+        if key in self._entries or (self.atlas is not None and self.atlas.covers(path, size)):
+            return
+        pending = self._pending.get(key)
+        if pending is not None:
+            loader, queued_priority = pending
+            # Bump a queued prefetch ahead of the backlog once its row becomes visible
+            if priority <= queued_priority or not self.pool.tryTake(loader):
+                return
         else:
-            color = "#E74C3C"  # Red
-            
-        self.status_indicator.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                border: none;
-                border-radius: 12px;
-            }}
-            QPushButton:hover {{
-                border: 2px solid {MODERN_COLORS["text_primary"]};
-            }}
-        """)
-        self.status_indicator.setToolTip(f"Days until renewal: {days}")
+            loader = LogoLoader(self, path, size)
+        self._pending[key] = (loader, priority)
+        self.pool.start(loader, priority)
+
+    def _store_image(self, path, size, image):
+        key = (path, size)
+        self._pending.pop(key, None)
+        if key not in self._entries:
+            self._insert(key, QPixmap.fromImage(image))
+        self.logo_ready.emit(path, size)
+
+    def _insert(self, key, pixmap):
+        self._entries[key] = pixmap
+        self.used_bytes += self._cost(pixmap)
+        while self.used_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.used_bytes -= self._cost(evicted)
+        return pixmap
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+logo_cache = LogoCache()
+
+def read_settings():
+    try:
+        with open("settings.json", "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_settings(values):
+    """Merge ``values`` into settings.json, keeping keys owned by other parts of the UI."""
+    settings = read_settings()
+    settings.update(values)
+    with open("settings.json", "w") as f:
+        json.dump(settings, f, indent=4)
+
+def read_saved_queries():
+    """Saved filter queries as ``{name: query text}``."""
+    return read_settings().get("saved_queries", {})
+
+def populate_saved_queries_menu(menu, triggered):
+    menu.clear()
+    queries = read_saved_queries()
+    if not queries:
+        menu.addAction("No saved queries").setEnabled(False)
+    for name, text in sorted(queries.items()):
+        action = menu.addAction(name)
+        action.setToolTip(text)
+        action.triggered.connect(lambda checked=False, text=text: triggered(text))
+
+# Lowest days-to-renewal of each status bucket; anything below the last is red
+STATUS_THRESHOLDS = ((16, "green"), (8, "yellow"), (3, "orange"))
+
+def renewal_status(days):
+    for threshold, status in STATUS_THRESHOLDS:
+        if days >= threshold:
+            return status
+    return "red"
+
+def renewal_status_color(days):
+    return STATUS_COLORS[renewal_status(days)]
+
+SORT_ORDERS = {
+    "Name (A-Z)": ("name", False),
+    "Name (Z-A)": ("name", True),
+    "Price (High-Low)": ("cost", True),
+    "Price (Low-High)": ("cost", False),
+    "Due Soon": ("renewal", False),
+    "Due Later": ("renewal", True),
+    "Recently Added": ("added", True),
+    "Oldest Added": ("added", False)
+}
+
+class SubscriptionListModel(QAbstractListModel):
+    """Presents the store through one of its sort indexes.
+
+    Rows map straight onto positions in the active ``SortedIndex`` (read
+    backwards for descending orders), so switching the order is a layout
+    permutation and single edits only insert, remove or move one row.
+    While a load streams in, rows are appended in load order instead and
+    ``finish_loading`` sorts them with a single reset.
+    """
+    SubscriptionRole = Qt.ItemDataRole.UserRole
+    StatusRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        # Shared with MainWindow.store, so mutations must go through the model
+        self.store = store
+        self.sort_field = "name"
+        self.descending = False
+        # Days to renewal are counted from this day until the next rollover
+        self.today = today_ordinal()
+        # Rows in load order while a load is running, otherwise None
+        self.loading = None
+        # Subscriptions let through by SubscriptionFilterProxy, or None without a search
+        self.matches = None
+
+    def ordering(self):
+        return self.store.sorted_by(self.sort_field)
+
+    def subscription_at(self, row):
+        if self.loading is not None:
+            return self.loading[row]
+        ordering = self.ordering()
+        return ordering[len(ordering) - 1 - row if self.descending else row]
+
+    def row_of(self, sub):
+        if self.loading is not None:
+            return self.loading.index(sub)
+        ordering = self.ordering()
+        position = ordering.position(sub)
+        return len(ordering) - 1 - position if self.descending else position
+
+    def insert_row_of(self, sub):
+        if self.loading is not None:
+            return len(self.loading)
+        ordering = self.ordering()
+        position = ordering.insert_position(sub)
+        return len(ordering) - position if self.descending else position
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        sub = self.subscription_at(index.row())
+        if role == SubscriptionFilterProxy.MatchRole:
+            return self.matches is not None and sub in self.matches
+        if role == Qt.ItemDataRole.DisplayRole:
+            return sub.name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"Days until renewal: {sub.days_to_renewal(self.today)}"
+        if role == self.StatusRole:
+            return renewal_status(sub.days_to_renewal(self.today))
+        if role == self.SubscriptionRole:
+            return sub
+        return None
+
+    def append_subscription(self, sub):
+        row = self.insert_row_of(sub)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.store.add(sub)
+        if self.loading is not None:
+            self.loading.append(sub)
+        self.endInsertRows()
+
+    def extend_subscriptions(self, subs):
+        if not subs:
+            return
+        if self.loading is None:
+            self.loading = list(self.ordering())
+        # A loaded batch lands all over the sorted order, so it is appended
+        # for now and sorted into place by finish_loading
+        first = len(self.loading)
+        self.beginInsertRows(QModelIndex(), first, first + len(subs) - 1)
+        self.store.extend(subs)
+        self.loading.extend(subs)
+        self.endInsertRows()
+
+    def finish_loading(self):
+        if self.loading is None:
+            return
+        self.beginResetModel()
+        self.loading = None
+        self.endResetModel()
+
+    def remove_subscription(self, sub):
+        row = self.row_of(sub)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.store.remove(sub)
+        if self.loading is not None:
+            del self.loading[row]
+        self.endRemoveRows()
+
+    def update_subscription(self, sub, **fields):
+        row = self.row_of(sub)
+        # Rows keep their place while loading; otherwise find where the
+        # edited copy sorts before touching the store, so the move is
+        # announced against the current rows
+        target = row
+        if self.loading is None:
+            edited = copy.copy(sub)
+            for field, value in fields.items():
+                setattr(edited, field, value)
+            target = self.insert_row_of(edited)
+        moved = target not in (row, row + 1)
+        if moved:
+            self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), target)
+        self.store.detach(sub)
+        for field, value in fields.items():
+            setattr(sub, field, value)
+        self.store.attach(sub)
+        if moved:
+            self.endMoveRows()
+            row = target if target < row else target - 1
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def rollover(self, today):
+        """Move to a new day, repainting only rows whose status bucket changed.
+
+        A subscription changes bucket when its days to renewal drop below a
+        threshold, i.e. when ``renewal_day - threshold`` falls between the old
+        and the new day; those are range scans on the renewal index.
+        """
+        previous, self.today = self.today, today
+        if today == previous:
+            return 0
+        start_day, end_day = min(previous, today), max(previous, today)
+        renewals = self.store.sorted_by("renewal")
+        changed = set()
+        for threshold, _ in STATUS_THRESHOLDS:
+            start, stop = renewals.range_bounds(start_day + threshold, end_day + threshold, True, False)
+            changed.update(renewals.slice(start, stop))
+        roles = [self.StatusRole, Qt.ItemDataRole.ToolTipRole]
+        for sub in changed:
+            index = self.index(self.row_of(sub))
+            self.dataChanged.emit(index, index, roles)
+        return len(changed)
+
+    def set_sort_order(self, field, descending=False):
+        if (field, descending) == (self.sort_field, self.descending):
+            return
+        self.layoutAboutToBeChanged.emit([], QAbstractItemModel.LayoutChangeHint.VerticalSortHint)
+        previous = self.persistentIndexList()
+        subs = [self.subscription_at(index.row()) for index in previous]
+        self.sort_field = field
+        self.descending = descending
+        self.changePersistentIndexList(previous, [self.index(self.row_of(sub)) for sub in subs])
+        self.layoutChanged.emit([], QAbstractItemModel.LayoutChangeHint.VerticalSortHint)
+
+class SubscriptionFilterProxy(QSortFilterProxyModel):
+    """Shows only the subscriptions matched by the current search.
+
+    The match set lives on the source model as ``matches`` and is read back
+    through ``MatchRole`` by Qt's built-in fixed-string filter. While no
+    search is active the filter string is empty, so loads and resets accept
+    rows without calling back into Python. With fuzzy scores set, rows are
+    ranked best match first; otherwise the source model's sort order is kept.
+    """
+    MatchRole = Qt.ItemDataRole.UserRole + 8
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.scores = None
+        self.setSourceModel(source)
+        self.setFilterRole(self.MatchRole)
+
+    @property
+    def matches(self):
+        return self.sourceModel().matches
+
+    def set_matches(self, matches, scores=None):
+        source = self.sourceModel()
+        if matches is None and source.matches is None:
+            return
+        previous, source.matches, self.scores = source.matches, matches, scores
+        if matches is None:
+            self.setFilterFixedString("")
+        elif previous is None:
+            # Turning the filter on checks every row once
+            self.setFilterFixedString("true")
+        else:
+            # Only rows whose visibility flips are removed from or inserted into the view
+            self.invalidateRowsFilter()
+        self.sort(0 if scores else -1)
+
+    def add_matches(self, matches, scores=None):
+        """Admit matches among rows about to be inserted, without re-filtering the rest."""
+        self.matches.update(matches)
+        if scores:
+            self.scores.update(scores)
+
+    def lessThan(self, left, right):
+        source = self.sourceModel()
+        left_score = self.scores.get(source.subscription_at(left.row()), 0)
+        right_score = self.scores.get(source.subscription_at(right.row()), 0)
+        if left_score != right_score:
+            return left_score > right_score
+        return left.row() < right.row()
+
+class SubscriptionDelegate(QStyledItemDelegate):
+    menu_requested = pyqtSignal(QModelIndex, QPoint)
+    status_clicked = pyqtSignal(QModelIndex)
+
+    CARD_SIZE = QSize(390, 120)
+    LOGO_SIZE = CARD_LOGO_SIZE
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.colors = MODERN_COLORS
+
+    def sizeHint(self, option, index):
+        return self.CARD_SIZE
+
+    def menu_rect(self, rect):
+        return QRect(rect.right() - 16 - 32, rect.top() + 8, 32, 32)
+
+    def status_rect(self, rect):
+        return QRect(rect.right() - 16 - 28, rect.bottom() - 16 - 24, 24, 24)
+
+    def paint(self, painter, option, index):
+        sub = index.data(SubscriptionListModel.SubscriptionRole)
+        if sub is None:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = option.rect
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(self.colors["card_hover" if hovered else "card"]))
+        painter.drawRoundedRect(QRectF(rect.adjusted(0, 0, 0, -4)), 8, 8)
+
+        logo_rect = QRect(rect.left() + 16, rect.top() + 8, self.LOGO_SIZE, self.LOGO_SIZE)
+        pixmap = logo_cache.cached_pixmap(sub.logo, self.LOGO_SIZE)
+        if pixmap is None:
+            logo_cache.request(sub.logo, self.LOGO_SIZE, LogoCache.VISIBLE_PRIORITY)
+            self.paint_logo_placeholder(painter, logo_rect, sub)
+        else:
+            # Logos keep their aspect ratio, so centre them rather than stretch to the square
+            painter.drawPixmap(QPoint(logo_rect.left() + (logo_rect.width() - pixmap.width()) // 2,
+                                      logo_rect.top() + (logo_rect.height() - pixmap.height()) // 2), pixmap)
+
+        text_left = logo_rect.right() + 16
+        text_width = self.menu_rect(rect).left() - text_left - 8
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor(self.colors["text_primary"]))
+        painter.drawText(QRect(text_left, rect.top() + 8, text_width, 22),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         painter.fontMetrics().elidedText(sub.name, Qt.TextElideMode.ElideRight, text_width))
+        painter.setFont(option.font)
+        painter.setPen(QColor(self.colors["text_secondary"]))
+        painter.drawText(QRect(text_left, rect.top() + 32, text_width, 20),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         f"Renewal: {sub.renewal_date}")
+        painter.drawText(QRect(text_left, rect.top() + 54, text_width, 20),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         f"${sub.cost:.2f}/{period_label(sub.frequency)}")
+
+        menu_rect = self.menu_rect(rect)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(self.colors["button_hover" if hovered else "button"]))
+        painter.drawEllipse(menu_rect)
+        menu_font = QFont(option.font)
+        menu_font.setPixelSize(18)
+        painter.setFont(menu_font)
+        painter.setPen(QColor(self.colors["text_primary"]))
+        painter.drawText(menu_rect, Qt.AlignmentFlag.AlignCenter, "⋮")
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(STATUS_COLORS[index.data(SubscriptionListModel.StatusRole)]))
+        painter.drawEllipse(self.status_rect(rect))
+
+        gradient = QLinearGradient(rect.left(), 0, rect.right(), 0)
+        gradient.setColorAt(0, Qt.GlobalColor.transparent)
+        gradient.setColorAt(0.2, QColor(self.colors["border"]))
+        gradient.setColorAt(0.8, QColor(self.colors["border"]))
+        gradient.setColorAt(1, Qt.GlobalColor.transparent)
+        painter.fillRect(QRect(rect.left(), rect.bottom() - 2, rect.width(), 2), gradient)
+        painter.restore()
+
+    def paint_logo_placeholder(self, painter, rect, sub):
+        painter.save()
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(sub.color))
+        painter.drawRoundedRect(QRectF(rect), 8, 8)
+        font = painter.font()
+        font.setBold(True)
+        font.setPixelSize(rect.height() // 2)
+        painter.setFont(font)
+        painter.setPen(QColor("#FFFFFF"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, sub.name[:1].upper())
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            pos = event.position().toPoint()
+            menu_rect = self.menu_rect(option.rect)
+            if menu_rect.contains(pos):
+                self.menu_requested.emit(index, menu_rect.bottomRight())
+                return True
+            if self.status_rect(option.rect).contains(pos):
+                self.status_clicked.emit(index)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+class SubscriptionLoader(QObject):
+    """Streams subscriptions out of a storage backend in batches driven by the event loop.
+
+    Each timer tick reads at most ``batch_size`` records, so the window stays
+    responsive and only one batch is held outside the store at a time.
+    """
+    batch_loaded = pyqtSignal(list)
+    progress = pyqtSignal(int)
+    finished = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, storage, batch_size=500, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self.batch_size = batch_size
+        self.reader = None
+        self.records = None
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.load_batch)
+
+    def start(self):
+        try:
+            self.reader = self.storage.open_reader()
+        except (OSError, sqlite3.Error) as e:
+            self.failed.emit(str(e))
+            self.finished.emit()
+            return
+        self.records = iter(self.reader)
+        self.timer.start()
+
+    def load_batch(self):
+        batch = []
+        try:
+            for sub in self.records:
+                batch.append(sub)
+                if len(batch) >= self.batch_size:
+                    break
+            else:
+                self.stop()
+        except (ValueError, sqlite3.Error) as e:
+            self.stop()
+            self.failed.emit(str(e))
+        if batch:
+            self.batch_loaded.emit(batch)
+        if self.reader is not None:
+            self.progress.emit(self.reader.progress())
+        else:
+            self.progress.emit(100)
+            self.finished.emit()
+
+    def drain(self):
+        while self.reader is not None:
+            self.load_batch()
+
+    def stop(self):
+        self.timer.stop()
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+
+class AnalyticsJob(QRunnable):
+    def __init__(self, worker, generation, request):
+        super().__init__()
+        self.worker = worker
+        self.generation = generation
+        self.request = request
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            result = compute_analytics(self.request, lambda: self.worker.generation != self.generation)
+        except Exception as e:
+            result = e
+        self.worker.job_finished.emit(self.generation, result)
+
+class AnalyticsWorker(QObject):
+    """Runs analytics requests one at a time on a background thread.
+
+    ``cancel`` makes the running job stale; it stops at its next check and
+    its result is dropped. Requests submitted while a job runs replace
+    each other, so at most one is ever waiting and only the newest runs.
+    """
+    job_finished = pyqtSignal(int, object)
+    result_ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.generation = 0
+        self.job = None
+        self.pending = None
+        self.job_finished.connect(self.on_job_finished)
+
+    def cancel(self):
+        self.generation += 1
+
+    def submit(self, request):
+        if self.job is not None:
+            self.pending = request
+            return
+        self.job = AnalyticsJob(self, self.generation, request)
+        self.pool.start(self.job)
+
+    def on_job_finished(self, generation, result):
+        self.job = None
+        if generation == self.generation:
+            if isinstance(result, Exception):
+                self.failed.emit(str(result))
+            elif result is not None:
+                self.result_ready.emit(result)
+        if self.pending is not None:
+            request, self.pending = self.pending, None
+            self.submit(request)
+
+    def shutdown(self):
+        self.pending = None
+        self.cancel()
+        self.pool.waitForDone()
 
 class SubscriptionStats(QWidget):
     def __init__(self, parent=None):
+        # QtCharts is only imported once the Analytics tab is first opened
+        from PyQt6.QtCharts import QBarCategoryAxis, QChart, QChartView, QDateTimeAxis, QValueAxis
+
         super().__init__(parent)
         layout = QVBoxLayout(self)
         
         
         select_button = QPushButton("Select Subscriptions")
         select_button.clicked.connect(self.show_selection_dialog)
-        layout.addWidget(select_button)
+        query_button = QPushButton("Select by Query")
+        query_menu = QMenu(query_button)
+        query_menu.aboutToShow.connect(lambda: populate_saved_queries_menu(query_menu, self.select_by_query))
+        query_button.setMenu(query_menu)
+        select_layout = QHBoxLayout()
+        select_layout.addWidget(select_button)
+        select_layout.addWidget(query_button)
+        layout.addLayout(select_layout)
         
         
         self.chart = QChart()
@@ -279,139 +837,410 @@ class SubscriptionStats(QWidget):
         self.chart.setBackgroundBrush(QColor(MODERN_COLORS["background"]))
         self.chart.setTitleBrush(QColor(MODERN_COLORS["text_primary"]))
         self.chart.setTitle("Monthly Spending")
+        self.chart.legend().setVisible(False)
+        # Axes are created once and reused; removed chart axes leave their labels behind
+        self.bar_axis_names = QBarCategoryAxis()
+        self.bar_axis_names.setTruncateLabels(False)
+        self.bar_axis_names.setLabelsColor(QColor(MODERN_COLORS["text_primary"]))
+        self.chart.addAxis(self.bar_axis_names, Qt.AlignmentFlag.AlignLeft)
+        self.bar_axis_cost = QValueAxis()
+        self.bar_axis_cost.setTickCount(4)
+        self.bar_axis_cost.setLabelsColor(QColor(MODERN_COLORS["text_primary"]))
+        self.chart.addAxis(self.bar_axis_cost, Qt.AlignmentFlag.AlignBottom)
         
         self.chart_view = QChartView(self.chart)
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.chart_view.setMinimumHeight(400)  
-        layout.addWidget(self.chart_view)
-        
-        
+        self.chart_view.setMinimumHeight(300)
+
+        self.forecast_chart = QChart()
+        self.forecast_chart.setBackgroundBrush(QColor(MODERN_COLORS["background"]))
+        self.forecast_chart.setTitleBrush(QColor(MODERN_COLORS["text_primary"]))
+        self.forecast_chart.setTitle("Spending Forecast")
+        self.forecast_chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
+        self.forecast_chart.legend().setLabelColor(QColor(MODERN_COLORS["text_primary"]))
+        self.forecast_axis_x = QDateTimeAxis()
+        self.forecast_axis_x.setFormat("MM/yy")
+        self.forecast_axis_x.setLabelsColor(QColor(MODERN_COLORS["text_primary"]))
+        self.forecast_chart.addAxis(self.forecast_axis_x, Qt.AlignmentFlag.AlignBottom)
+        self.forecast_axes_y = []
+        for alignment in (Qt.AlignmentFlag.AlignLeft, Qt.AlignmentFlag.AlignRight):
+            axis_y = QValueAxis()
+            axis_y.setTickCount(5)
+            axis_y.setLabelsColor(QColor(MODERN_COLORS["text_primary"]))
+            self.forecast_chart.addAxis(axis_y, alignment)
+            self.forecast_axes_y.append(axis_y)
+        self.forecast_view = QChartView(self.forecast_chart)
+        self.forecast_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.forecast_view.setMinimumHeight(300)
+
+        self.horizon_input = QSpinBox()
+        self.horizon_input.setRange(1, 120)
+        self.horizon_input.setValue(12)
+        self.horizon_unit = QComboBox()
+        self.horizon_unit.addItems(["Months", "Years"])
+        self.horizon_input.valueChanged.connect(self.invalidate_forecast)
+        self.horizon_unit.currentIndexChanged.connect(self.invalidate_forecast)
+        horizon_layout = QHBoxLayout()
+        horizon_layout.addWidget(QLabel("Forecast horizon:"))
+        horizon_layout.addWidget(self.horizon_input)
+        horizon_layout.addWidget(self.horizon_unit)
+        horizon_layout.addStretch()
+        self.forecast_summary = QLabel()
+        self.forecast_summary.setWordWrap(True)
+
+        forecast_page = QWidget()
+        forecast_layout = QVBoxLayout(forecast_page)
+        forecast_layout.addLayout(horizon_layout)
+        forecast_layout.addWidget(self.forecast_view)
+        forecast_layout.addWidget(self.forecast_summary)
+
         self.stats_text = QTextEdit()
         self.stats_text.setReadOnly(True)
-        self.stats_text.setMinimumHeight(200)  
-        layout.addWidget(self.stats_text)
+        self.stats_text.setMinimumHeight(120)
+
+        self.top_n_input = QSpinBox()
+        self.top_n_input.setRange(3, 50)
+        self.top_n_input.setValue(CHART_TOP_N)
+        self.top_n_input.valueChanged.connect(self.invalidate_graph)
+        top_n_layout = QHBoxLayout()
+        top_n_layout.addWidget(QLabel("Show top:"))
+        top_n_layout.addWidget(self.top_n_input)
+        top_n_layout.addStretch()
+
+        selection_page = QWidget()
+        selection_layout = QVBoxLayout(selection_page)
+        selection_layout.addLayout(top_n_layout)
+        selection_layout.addWidget(self.chart_view)
+        selection_layout.addWidget(self.stats_text)
+
+        self.views = QTabWidget()
+        self.views.addTab(selection_page, "Selection")
+        self.forecast_index = self.views.addTab(forecast_page, "Forecast")
+        self.views.currentChanged.connect(self.schedule_refresh)
+        layout.addWidget(self.views)
         
         self.selected_subscriptions = []
         self.all_subscriptions = []
+        self.graph_stale = True
+        self.forecast_stale = True
+        # Coalesces every change made in one pass of the event loop into a single redraw
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh_charts)
+        self.worker = AnalyticsWorker(self)
+        self.worker.result_ready.connect(self.apply_result)
+        self.worker.failed.connect(self.show_error)
     
     def update_subscriptions(self, subscriptions):
        
         self.all_subscriptions = subscriptions
-        self.selected_subscriptions = []  
-        self.update_graph()  
+        # Keep the selection across edits, minus anything that was deleted
+        self.selected_subscriptions = [sub for sub in self.selected_subscriptions if sub in subscriptions]
+        self.graph_stale = True
+        self.forecast_stale = True
+        self.schedule_refresh()
+
+    def invalidate_graph(self):
+        self.graph_stale = True
+        self.schedule_refresh()
+
+    def invalidate_forecast(self):
+        self.forecast_stale = True
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        # Whatever is being computed no longer reflects the latest state
+        self.worker.cancel()
+        self.refresh_timer.start(0)
+
+    def refresh_charts(self):
+        # The forecast is only computed while its view is showing
+        want_forecast = self.forecast_stale and self.views.currentIndex() == self.forecast_index
+        if not self.graph_stale and not want_forecast:
+            return
+        aggregates = getattr(self.all_subscriptions, "aggregates", None)
+        self.worker.submit(AnalyticsRequest(
+            selection=tuple(self.selected_subscriptions),
+            subscriptions=tuple(self.all_subscriptions) if want_forecast else (),
+            aggregates=aggregates.snapshot() if aggregates is not None else None,
+            top_n=self.top_n_input.value(),
+            horizon=self.horizon_months(),
+            today=today_ordinal(),
+            # About one point per two pixels of plot width is all a line can show
+            line_points=max(64, int(self.forecast_chart.plotArea().width()) // 2),
+            graph=self.graph_stale,
+            forecast=want_forecast
+        ))
+
+    def apply_result(self, result):
+        if result.bars is not None:
+            self.graph_stale = False
+            self.update_graph(result.bars)
+        if result.forecast is not None:
+            self.forecast_stale = False
+            self.update_forecast(result.forecast)
+
+    def show_error(self, message):
+        QMessageBox.warning(self, "Error", f"Failed to update graph: {message}")
+
+    def horizon_months(self):
+        return self.horizon_input.value() * (12 if self.horizon_unit.currentText() == "Years" else 1)
+
+    def update_forecast(self, data):
+        from PyQt6.QtCharts import QLineSeries
+
+        chart = self.forecast_chart
+        months = len(data.forecast.months)
+        set_chart_animation(chart, months)
+        chart.removeAllSeries()
+        label_format = "$%.0fk" if data.scale > 1 else "$%.0f"
+        peaks = (data.forecast.per_month.max(initial=0), data.forecast.total)
+        for (name, points), axis_y, peak in zip(data.series, self.forecast_axes_y, peaks):
+            series = QLineSeries()
+            series.setName(name)
+            series.replace([QPointF(x, y) for x, y in points])
+            chart.addSeries(series)
+            axis_y.setRange(0, max(peak / data.scale, 1) * 1.1)
+            axis_y.setLabelFormat(label_format)
+            series.attachAxis(self.forecast_axis_x)
+            series.attachAxis(axis_y)
+        first, last = data.series[0][1][0][0], data.series[0][1][-1][0]
+        self.forecast_axis_x.setTickCount(min(months, 7) if months > 1 else 2)
+        self.forecast_axis_x.setRange(QDateTime.fromMSecsSinceEpoch(int(first)), QDateTime.fromMSecsSinceEpoch(int(last)))
+        self.forecast_summary.setText(data.summary)
+
     def show_selection_dialog(self):
-        dialog = SelectSubscriptionsDialog(self.all_subscriptions, self)
+        dialog = SelectSubscriptionsDialog(self.all_subscriptions, self, self.selected_subscriptions)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.selected_subscriptions = dialog.get_selected_subscriptions()
-            self.update_graph()
-    
-    def update_graph(self):
+            self.invalidate_graph()
+
+    def select_by_query(self, text):
         try:
-            self.chart.removeAllSeries()
-            if not self.selected_subscriptions:
-                return
-                
-           
-            series = QBarSeries()
-            costs = []
-            
-           
-            for sub in self.selected_subscriptions:
-                bar_set = QBarSet(sub.name)
-                cost = float(sub.cost)
-                bar_set.append(cost)
-                series.append(bar_set)
-                costs.append(cost)
-            
-            
-            self.chart.addSeries(series)
-            
-           
-            axis_x = QBarCategoryAxis()
-            axis_x.append("Monthly Cost")
-            axis_x.setLabelsColor(QColor(MODERN_COLORS["text_primary"]))
-            
-            axis_y = QValueAxis()
-            max_cost = max(costs) if costs else 0
-            axis_y.setRange(0, max_cost * 1.2)
-            axis_y.setLabelsColor(QColor(MODERN_COLORS["text_primary"]))
-            
-            
-            self.chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
-            self.chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
-            series.attachAxis(axis_x)
-            series.attachAxis(axis_y)
-            
-            
-            self.chart.legend().setVisible(True)
-            self.chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
-            self.chart.legend().setLabelColor(QColor(MODERN_COLORS["text_primary"]))
-            
-           
-            total = sum(costs)
-            yearly = total * 12
-            stats = f"""Selected Subscriptions Summary:
-            Monthly Total: ${total:.2f}
-            Yearly Total: ${yearly:.2f}
-            Number of Subscriptions: {len(self.selected_subscriptions)}
-            """
-            self.stats_text.setText(stats)
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to update graph: {str(e)}")
+            matches = parse_query(text).predicate()
+        except QueryError as e:
+            QMessageBox.warning(self, "Invalid Query", str(e))
+            return
+        self.selected_subscriptions = [sub for sub in self.all_subscriptions if matches(sub)]
+        self.invalidate_graph()
+
+    def update_graph(self, bars):
+        from PyQt6.QtCharts import QBarSet, QHorizontalBarSeries
+
+        self.chart.removeAllSeries()
+        self.bar_axis_names.clear()
+        self.stats_text.setText(bars.text)
+        if not bars.count:
+            return
+        set_chart_animation(self.chart, bars.count)
+        # Horizontal bars are drawn bottom-up, so reverse to list the largest first
+        bar_set = QBarSet("Monthly cost")
+        bar_set.append(bars.values[::-1].tolist())
+        series = QHorizontalBarSeries()
+        series.append(bar_set)
+        self.chart.addSeries(series)
+        self.bar_axis_names.append(list(bars.labels[::-1]))
+        self.bar_axis_cost.setRange(0, float(bars.values.max()) * 1.2)
+        self.bar_axis_cost.setLabelFormat("$%.0fk" if bars.scale > 1 else "$%.0f")
+        series.attachAxis(self.bar_axis_names)
+        series.attachAxis(self.bar_axis_cost)
 
 class ExportDialog(QDialog):
-    def __init__(self, parent=None):
+    """Picks the format, the subscriptions to include and the target file."""
+
+    def __init__(self, search_text="", parent=None):
         super().__init__(parent)
         self.setWindowTitle("Export Data")
-        layout = QVBoxLayout(self)
+        layout = QFormLayout(self)
+        self.path = None
         
         self.format_combo = QComboBox()
-        self.format_combo.addItems(["CSV", "PDF", "JSON"])
-        layout.addWidget(self.format_combo)
+        self.format_combo.addItems(EXPORT_FORMATS)
+        layout.addRow("Format:", self.format_combo)
+
+        # Each scope is the query text that selects its subscriptions
+        self.scope_combo = QComboBox()
+        self.scope_combo.addItem("All subscriptions", "")
+        if search_text:
+            self.scope_combo.addItem("Current search results", search_text)
+        for name, text in sorted(read_saved_queries().items()):
+            self.scope_combo.addItem(f"Saved query: {name}", text)
+        layout.addRow("Include:", self.scope_combo)
         
         export_button = QPushButton("Export")
         export_button.clicked.connect(self.export_data)
-        layout.addWidget(export_button)
+        layout.addRow(export_button)
+
+    def export_format(self):
+        return self.format_combo.currentText()
+
+    def query_text(self):
+        return self.scope_combo.currentData()
+
+    def export_data(self):
+        extension = EXPORT_FORMATS[self.export_format()]
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Subscriptions", f"subscriptions{extension}",
+            f"{self.export_format()} (*{extension});;All Files (*)"
+        )
+        if not path:
+            return
+        if not os.path.splitext(path)[1]:
+            path += extension
+        self.path = path
+        self.accept()
+
+class ExportJob(QRunnable):
+    def __init__(self, worker, subs, path, fmt, matches):
+        super().__init__()
+        self.worker = worker
+        self.subs = subs
+        self.path = path
+        self.fmt = fmt
+        self.matches = matches
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            result = export_subscriptions(self.subs, self.path, self.fmt, self.matches,
+                                          progress=self.worker.progress.emit,
+                                          cancelled=lambda: self.worker.cancelled)
+        except Exception as e:
+            result = e
+        self.worker.job_finished.emit(result)
+
+class ExportWorker(QObject):
+    """Runs one export at a time on a background thread.
+
+    ``cancel`` stops the running export at its next chunk; the partial file
+    is removed and ``cancelled_export`` is emitted instead of ``finished``.
+    """
+    job_finished = pyqtSignal(object)
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(str, int)
+    cancelled_export = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.job = None
+        self.cancelled = False
+        self.job_finished.connect(self.on_job_finished)
+
+    def busy(self):
+        return self.job is not None
+
+    def start(self, subs, path, fmt, matches=None):
+        self.cancelled = False
+        self.job = ExportJob(self, subs, path, fmt, matches)
+        self.pool.start(self.job)
+
+    def cancel(self):
+        self.cancelled = True
+
+    def on_job_finished(self, result):
+        job, self.job = self.job, None
+        if isinstance(result, ExportCancelled):
+            self.cancelled_export.emit()
+        elif isinstance(result, Exception):
+            self.failed.emit(str(result))
+        else:
+            self.finished.emit(job.path, result)
+
+    def shutdown(self):
+        self.cancel()
+        self.pool.waitForDone()
+
+class CatalogModel(QAbstractListModel):
+    """Rows of the provider catalog that match the current type-ahead text.
+
+    Icons are only requested when the view asks for a row's decoration,
+    i.e. for the rows actually on screen, and decode on the logo pool.
+    """
+    EntryRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.rows = catalog.search("")
+        logo_cache.logo_ready.connect(self.on_logo_ready)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.catalog[self.rows[index.row()]]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry.name
+        if role == Qt.ItemDataRole.DecorationRole:
+            pixmap = logo_cache.cached_pixmap(entry.logo, LIST_ICON_SIZE)
+            if pixmap is None:
+                logo_cache.request(entry.logo, LIST_ICON_SIZE, LogoCache.VISIBLE_PRIORITY)
+                return QColor(entry.color)
+            return pixmap
+        if role == Qt.ItemDataRole.ToolTipRole and entry.category:
+            return f"{entry.category} - ${entry.cost:.2f}/{period_label(entry.frequency)}"
+        if role == self.EntryRole:
+            return entry
+        return None
+
+    def set_query(self, text):
+        self.beginResetModel()
+        self.rows = self.catalog.search(text)
+        self.endResetModel()
+
+    def row_of(self, entry):
+        for row, entry_id in enumerate(self.rows):
+            if self.catalog[entry_id] is entry:
+                return row
+        return -1
+
+    def on_logo_ready(self, path, size):
+        if size == LIST_ICON_SIZE and self.rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), [Qt.ItemDataRole.DecorationRole])
 
 class AddSubscriptionDialog(QDialog):
+    """Add/edit form. MainWindow keeps one instance and calls ``prepare``
+    before each use instead of rebuilding the catalog list every time."""
+
     def __init__(self, subscription=None, parent=None):
         super().__init__(parent)
-        self.setWindowTitle("Add/Edit Subscription")
         self.setFixedSize(450, 600)
         
         form_layout = QFormLayout()
         
-        
-        self.subscription_list = QListWidget()
-        for sub in PREDEFINED_SUBSCRIPTIONS:
-            item = QListWidgetItem(QIcon(sub["logo"]), sub["name"])
-            item.setData(Qt.ItemDataRole.UserRole, sub)
-            self.subscription_list.addItem(item)
-            
-       
-        if subscription:
-            self.current_subscription = {
-                "name": subscription.name,
-                "color": subscription.color,
-                "logo": subscription.logo
-            }
-        else:
-            self.current_subscription = None
-            
+        self.catalog_search = QLineEdit()
+        self.catalog_search.setPlaceholderText("Search providers...")
+        self.catalog_search.setClearButtonEnabled(True)
+        self.catalog_search.textChanged.connect(self.filter_catalog)
+        self.catalog_search.returnPressed.connect(self.pick_first_match)
+
+        self.catalog_model = CatalogModel(get_catalog(), self)
+        self.subscription_list = QListView()
+        self.subscription_list.setUniformItemSizes(True)
+        self.subscription_list.setIconSize(QSize(LIST_ICON_SIZE, LIST_ICON_SIZE))
+        self.subscription_list.setModel(self.catalog_model)
+        self.subscription_list.selectionModel().currentChanged.connect(self.on_entry_changed)
        
         self.date_input = QDateEdit()
         self.date_input.setCalendarPopup(True)
-        self.date_input.setDate(QDate.currentDate() if not subscription else QDate.fromString(subscription.renewal_date, "yyyy-MM-dd"))
         
         self.cost_input = QLineEdit()
-        self.cost_input.setText(subscription.cost if subscription else "")
         self.cost_input.setValidator(QDoubleValidator(0.00, 999999.99, 2))
+
+        self.frequency_input = QComboBox()
+        self.frequency_input.addItems(BILLING_FREQUENCIES)
         
         
-        form_layout.addRow("Choose Subscription:", self.subscription_list)
+        form_layout.addRow("Choose Subscription:", self.catalog_search)
+        form_layout.addRow(self.subscription_list)
         form_layout.addRow("Renewal Date:", self.date_input)
         form_layout.addRow("Cost ($):", self.cost_input)
+        form_layout.addRow("Billed:", self.frequency_input)
         
         
         self.submit_button = QPushButton("Save")
@@ -419,14 +1248,65 @@ class AddSubscriptionDialog(QDialog):
         form_layout.addWidget(self.submit_button)
         
         self.setLayout(form_layout)
-        
-       
+        self.prepare(subscription)
+
+    def prepare(self, subscription=None):
+        """Reset the form for adding a subscription, or for editing ``subscription``."""
+        self.setWindowTitle("Edit Subscription" if subscription else "Add Subscription")
         if subscription:
-            for i in range(self.subscription_list.count()):
-                item = self.subscription_list.item(i)
-                if item.text() == subscription.name:
-                    self.subscription_list.setCurrentItem(item)
-                    break
+            self.current_subscription = {
+                "name": subscription.name,
+                "color": subscription.color,
+                "logo": subscription.logo,
+                "category": subscription.category
+            }
+        else:
+            self.current_subscription = None
+        self.editing = subscription is not None
+
+        self.catalog_search.blockSignals(True)
+        self.catalog_search.clear()
+        self.catalog_search.blockSignals(False)
+        self.catalog_model.set_query("")
+        self.date_input.setDate(QDate.currentDate() if not subscription else QDate.fromString(subscription.renewal_date, "yyyy-MM-dd"))
+        self.cost_input.setText(f"{subscription.cost:.2f}" if subscription else "")
+        self.frequency_input.setCurrentText(subscription.frequency if subscription else BILLING_FREQUENCIES[0])
+
+        entry = self.catalog_model.catalog.find(subscription.name) if subscription else None
+        row = self.catalog_model.row_of(entry) if entry else -1
+        self.select_row(row)
+        self.catalog_search.setFocus()
+
+    def select_row(self, row):
+        selection = self.subscription_list.selectionModel()
+        if row < 0:
+            selection.clear()
+            return
+        index = self.catalog_model.index(row)
+        selection.setCurrentIndex(index, selection.SelectionFlag.ClearAndSelect)
+        self.subscription_list.scrollTo(index)
+
+    def filter_catalog(self, text):
+        entry = self.selected_entry()
+        self.catalog_model.set_query(text)
+        row = self.catalog_model.row_of(entry) if entry else -1
+        self.select_row(row if row >= 0 or not text.strip() else 0 if self.catalog_model.rows else -1)
+
+    def pick_first_match(self):
+        if self.catalog_model.rows:
+            self.select_row(0)
+            self.cost_input.setFocus()
+
+    def selected_entry(self):
+        index = self.subscription_list.selectionModel().currentIndex()
+        return index.data(CatalogModel.EntryRole) if index.isValid() else None
+
+    def on_entry_changed(self, current, previous):
+        entry = current.data(CatalogModel.EntryRole) if current.isValid() else None
+        # Fill in the provider's usual price for new subscriptions only
+        if entry is not None and not self.editing:
+            self.cost_input.setText(f"{entry.cost:.2f}")
+            self.frequency_input.setCurrentText(entry.frequency)
 
     def pick_color(self):
         color = QColorDialog.getColor(QColor(self.current_color), self)
@@ -444,8 +1324,15 @@ class AddSubscriptionDialog(QDialog):
         """)
 
     def get_selected_data(self):
-        selected_item = self.subscription_list.currentItem()
-        selected_data = selected_item.data(Qt.ItemDataRole.UserRole) if selected_item else self.current_subscription
+        entry = self.selected_entry()
+        if entry is not None:
+            selected_data = {"name": entry.name, "logo": entry.logo, "color": entry.color, "category": entry.category}
+            current = self.current_subscription
+            if current and current["name"] == entry.name and current["category"]:
+                # Keep a category the user already gave this subscription
+                selected_data["category"] = current["category"]
+        else:
+            selected_data = self.current_subscription
         
         if not selected_data:
             raise ValueError("Please select a subscription")
@@ -458,10 +1345,14 @@ class AddSubscriptionDialog(QDialog):
             },
             "renewal_date": self.date_input.date(),
             "cost": self.cost_input.text() or "0.00",
+            "frequency": self.frequency_input.currentText(),
+            "category": selected_data["category"],
             "color": selected_data["color"]
         }
 
 class MainWindow(QMainWindow):
+    save_failed = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Subscription Manager")
@@ -474,35 +1365,73 @@ class MainWindow(QMainWindow):
         self.central_widget.setLayout(self.main_layout)
 
        
-        self.tray_icon = QSystemTrayIcon(QIcon(DEFAULT_ICON), self)
+        self.tray_icon = QSystemTrayIcon(logo_cache.icon(DEFAULT_ICON, TRAY_ICON_SIZE), self)
         self.tray_icon.show()
 
        
         self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Search subscriptions...")
-        self.search_bar.textChanged.connect(self.filter_subscriptions)
-        self.main_layout.addWidget(self.search_bar)
+        self.search_bar.setPlaceholderText("Search, e.g. netflix cost>10 due<7d category:Streaming")
+        self.fuzzy_search = QCheckBox("Fuzzy")
+        self.queries_button = QPushButton("Queries")
+        self.queries_menu = QMenu(self.queries_button)
+        self.queries_menu.aboutToShow.connect(self.populate_queries_menu)
+        self.queries_button.setMenu(self.queries_menu)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.filter_subscriptions)
+        self.search_bar.textChanged.connect(self.search_timer.start)
+        self.fuzzy_search.toggled.connect(self.filter_subscriptions)
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(self.search_bar)
+        search_layout.addWidget(self.fuzzy_search)
+        search_layout.addWidget(self.queries_button)
+        self.main_layout.addLayout(search_layout)
 
        
         self.total_cost_label = QLabel("Total Monthly Cost: $0.00")
-        self.total_cost_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.total_cost_label.setObjectName("totalCostLabel")
         
        
-        self.stats_widget = SubscriptionStats()
+        self.stats_widget = None
+        self.add_dialog = None
         self.tab_widget = QTabWidget()
         
        
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setMinimumHeight(500) 
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_content.setLayout(self.scroll_layout)
-        self.scroll_area.setWidget(self.scroll_content)
+        self.store = SubscriptionStore()
+        settings = read_settings()
+        self.storage = create_backend(settings.get("storage_backend", "JSON"), settings.get("binary_snapshot", True))
+        # Emitted from the writer thread; the queued connection shows the error on the GUI thread
+        self.save_failed.connect(lambda message: QMessageBox.warning(self, "Error", f"Failed to save data: {message}"))
+        self.writer = WriteBehindWriter(self.storage, on_error=lambda e: self.save_failed.emit(str(e)))
+        self.subscription_model = SubscriptionListModel(self.store, self)
+        self.subscription_delegate = SubscriptionDelegate(self)
+        self.subscription_delegate.menu_requested.connect(self.show_subscription_menu)
+        self.subscription_delegate.status_clicked.connect(self.show_days_to_renewal)
+
+        self.list_view = QListView()
+        self.filter_proxy = SubscriptionFilterProxy(self.subscription_model, self)
+        self.list_view.setModel(self.filter_proxy)
+        # The last valid search, reused to filter batches that arrive during a load
+        self.search_query = None
+        self.search_fuzzy = False
+        self.list_view.setItemDelegate(self.subscription_delegate)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.list_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.list_view.setSpacing(4)
+        self.list_view.setMinimumHeight(500)
+        logo_cache.logo_ready.connect(lambda path, size: self.list_view.viewport().update())
+
+        self.subscription_menu = QMenu(self)
+        self.edit_action = self.subscription_menu.addAction("Edit")
+        self.delete_action = self.subscription_menu.addAction("Delete")
         
       
-        self.tab_widget.addTab(self.scroll_area, "Subscriptions")
-        self.tab_widget.addTab(self.stats_widget, "Analytics")
+        self.tab_widget.addTab(self.list_view, "Subscriptions")
+        self.analytics_index = self.tab_widget.addTab(QWidget(), "Analytics")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
        
         self.sort_combo = QComboBox()
@@ -522,25 +1451,63 @@ class MainWindow(QMainWindow):
         self.add_button.clicked.connect(self.open_add_subscription_dialog)
         
        
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setFormat("Loading subscriptions... %p%")
+        self.load_progress.hide()
+        self.loader = None
+        self.load_failed = False
+        self.save_pending = False
+        # Single-record writes made while a load is running, replayed once it ends
+        self.pending_changes = []
+
+        self.budget_gauge = QProgressBar()
+        self.budget_gauge.setObjectName("budgetGauge")
+        self.budget_gauge.setRange(0, 100)
+        self.budget_gauge.hide()
+        self.budget_monitor = BudgetMonitor()
+
         self.main_layout.addWidget(self.sort_combo)
+        self.main_layout.addWidget(self.load_progress)
         self.main_layout.addWidget(self.tab_widget)
         self.main_layout.addWidget(self.total_cost_label)
+        self.main_layout.addWidget(self.budget_gauge)
         self.main_layout.addWidget(self.add_button)
         
        
-        self.subscriptions = []
         self.load_data()
 
         
         menubar = self.menuBar()
+        file_menu = menubar.addMenu('File')
+        self.export_action = file_menu.addAction('Export...')
+        self.export_action.setShortcut("Ctrl+E")
+        self.export_action.triggered.connect(self.show_export_dialog)
+        self.export_worker = ExportWorker(self)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.failed.connect(self.on_export_failed)
+        self.export_worker.cancelled_export.connect(self.on_export_cancelled)
+        self.export_progress = None
         settings_menu = menubar.addMenu('Settings')
         settings_action = settings_menu.addAction('Preferences')
         settings_action.triggered.connect(self.open_settings)
         
        
         self.notification_status = QLabel()
+        self.notification_status.setObjectName("notificationStatus")
+        self.renewal_timer = QTimer(self)
+        self.renewal_timer.setSingleShot(True)
+        self.renewal_timer.timeout.connect(self.check_renewals)
+        self.reminders_enabled = False
         self.update_notification_status()
+        self.configure_reminders()
+        self.configure_budget()
+        self.rollover_timer = QTimer(self)
+        self.rollover_timer.setSingleShot(True)
+        self.rollover_timer.timeout.connect(self.on_day_rollover)
+        self.arm_rollover_timer()
         self.main_layout.addWidget(self.notification_status)
+        self.load_settings()
         
        
         self.sort_combo.clear()
@@ -557,166 +1524,371 @@ class MainWindow(QMainWindow):
 
     def open_add_subscription_dialog(self, subscription=None):
         try:
-            dialog = AddSubscriptionDialog(subscription, self)
+            dialog = self.add_dialog
+            if dialog is None:
+                dialog = self.add_dialog = AddSubscriptionDialog(subscription, self)
+            else:
+                dialog.prepare(subscription)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 data = dialog.get_selected_data()
                 
                 if subscription:
                     
-                    subscription.name = data["subscription"]["name"]
-                    subscription.renewal_date = data["renewal_date"].toString("yyyy-MM-dd")
-                    subscription.cost = data["cost"]
-                    subscription.color = data["color"]
-                    subscription.update_display()
+                    self.subscription_model.update_subscription(
+                        subscription,
+                        name=data["subscription"]["name"],
+                        renewal_date=data["renewal_date"].toString("yyyy-MM-dd"),
+                        cost=float(data["cost"]),
+                        color=data["color"],
+                        logo=data["subscription"]["logo"],
+                        category=data["category"],
+                        frequency=data["frequency"]
+                    )
+                    self.save_data(updated=subscription)
                 else:
                 
-                    card = SubscriptionCard(
+                    sub = Subscription(
                         name=data["subscription"]["name"],
                         renewal_date=data["renewal_date"].toString("yyyy-MM-dd"),
                         cost=float(data["cost"]),
                         color=data["color"],
                         logo=data["subscription"]["logo"],
-                        category="",  
-                        on_edit=self.edit_subscription,
-                        on_delete=self.delete_subscription,
-                        parent=self
+                        category=data["category"],
+                        frequency=data["frequency"]
                     )
-                    self.subscriptions.append(card)
-                    self.scroll_layout.addWidget(card)
+                    self.subscription_model.append_subscription(sub)
+                    self.save_data(added=sub)
+                self.refresh_search()
+                self.arm_renewal_timer()
                 
-                self.save_data()
                 self.update_total_cost()
-                self.stats_widget.update_subscriptions(self.subscriptions)  
+                self.refresh_stats()  
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to {('update' if subscription else 'add')} subscription: {str(e)}")
-        self.stats_widget.update_subscriptions(self.subscriptions)
 
-    def edit_subscription(self, card):
-        self.open_add_subscription_dialog(card)
+    def on_tab_changed(self, index):
+        if index != self.analytics_index or self.stats_widget is not None:
+            return
+        self.stats_widget = SubscriptionStats()
+        self.tab_widget.blockSignals(True)
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, self.stats_widget, "Analytics")
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        self.refresh_stats()
+
+    def refresh_stats(self):
+        if self.stats_widget is not None:
+            self.stats_widget.update_subscriptions(self.store)
+
+    def show_subscription_menu(self, index, pos):
+        sub = index.data(SubscriptionListModel.SubscriptionRole)
+        action = self.subscription_menu.exec(self.list_view.viewport().mapToGlobal(pos))
+        if action is self.edit_action:
+            self.edit_subscription(sub)
+        elif action is self.delete_action:
+            self.delete_subscription(sub)
+
+    def show_days_to_renewal(self, index):
+        sub = index.data(SubscriptionListModel.SubscriptionRole)
+        QMessageBox.information(self, "Days to Renewal", 
+            f"Days until renewal: {sub.days_to_renewal()}\nRenewal date: {sub.renewal_date}")
 
-    def delete_subscription(self, card):
-        confirmation = QMessageBox.question(self, "Delete Subscription", f"Are you sure you want to delete {card.name}?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+    def edit_subscription(self, sub):
+        self.open_add_subscription_dialog(sub)
+
+    def delete_subscription(self, sub):
+        confirmation = QMessageBox.question(self, "Delete Subscription", f"Are you sure you want to delete {sub.name}?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if confirmation == QMessageBox.StandardButton.Yes:
-            self.subscriptions.remove(card)
-            card.deleteLater()
-            self.save_data()
+            self.subscription_model.remove_subscription(sub)
+            self.refresh_search()
+            self.arm_renewal_timer()
+            self.save_data(removed=sub)
             self.update_total_cost()
-            self.stats_widget.update_subscriptions(self.subscriptions) 
+            self.refresh_stats() 
 
-    def filter_subscriptions(self):
-        query = self.search_bar.text().lower()
-        for card in self.subscriptions:
-            card.setVisible(query in card.name.lower())
+    def refresh_search(self):
+        if self.filter_proxy.matches is not None:
+            self.filter_subscriptions()
 
-    def update_total_cost(self):
+    def filter_subscriptions(self):
+        self.search_timer.stop()
+        text = self.search_bar.text().strip()
         try:
-            total_cost = 0
-            for card in self.subscriptions:
-                try:
-                    cost = float(card.cost.replace('$', '').strip())
-                    if cost > 0:
-                        total_cost += cost
-                except (ValueError, AttributeError):
-                    continue
-                    
-            self.total_cost_label.setText(f"Total Monthly Cost: ${total_cost:.2f}")
-        except Exception as e:
-            print(f"Error calculating total cost: {e}")
-            self.total_cost_label.setText("Total Monthly Cost: $0.00")
+            query = parse_query(text)
+        except QueryError as e:
+            # Keep the last valid filter while the query is being typed
+            set_style_property(self.search_bar, "invalid", True)
+            self.search_bar.setToolTip(str(e))
+            return
+        set_style_property(self.search_bar, "invalid", False)
+        self.search_bar.setToolTip("")
+        self.search_query = query
+        self.search_fuzzy = bool(self.fuzzy_search.isChecked() and query.words)
+        if not query:
+            self.filter_proxy.set_matches(None)
+        elif self.search_fuzzy:
+            scores = query.evaluate(self.store, fuzzy=True)
+            self.filter_proxy.set_matches(scores, scores)
+        else:
+            self.filter_proxy.set_matches(query.evaluate(self.store))
+
+    def populate_queries_menu(self):
+        populate_saved_queries_menu(self.queries_menu, self.search_bar.setText)
+        self.queries_menu.addSeparator()
+        save_action = self.queries_menu.addAction("Save Current Query...")
+        save_action.setEnabled(bool(self.search_bar.text().strip()))
+        save_action.triggered.connect(self.save_current_query)
+        queries = read_saved_queries()
+        if queries:
+            delete_menu = self.queries_menu.addMenu("Delete")
+            for name in sorted(queries):
+                delete_menu.addAction(name).triggered.connect(
+                    lambda checked=False, name=name: self.delete_saved_query(name))
 
-    def save_data(self):
+    def save_current_query(self):
+        text = self.search_bar.text().strip()
         try:
-            data = []
-            for card in self.subscriptions:
-                if hasattr(card, 'name'): 
-                    data.append({
-                        "name": card.name,
-                        "renewal_date": card.renewal_date,
-                        "cost": card.cost,
-                        "color": card.color,
-                        "logo": card.logo,
-                        "category": getattr(card, 'category', "")
-                    })
-            
-            with open("subscriptions.json", "w") as file:
-                json.dump(data, file, indent=4)
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to save data: {str(e)}")
+            parse_query(text)
+        except QueryError as e:
+            QMessageBox.warning(self, "Invalid Query", str(e))
+            return
+        name, ok = QInputDialog.getText(self, "Save Query", "Name:", text=text)
+        if ok and name.strip():
+            queries = read_saved_queries()
+            queries[name.strip()] = text
+            write_settings({"saved_queries": queries})
+
+    def delete_saved_query(self, name):
+        queries = read_saved_queries()
+        queries.pop(name, None)
+        write_settings({"saved_queries": queries})
+
+    def update_total_cost(self):
+        self.total_cost_label.setText(f"Total Monthly Cost: ${self.store.total_cost():.2f}")
+        by_currency = self.store.aggregates.by_currency
+        self.total_cost_label.setToolTip("\n".join(
+            f"{currency}: {monthly:.2f}/month ({count})" for currency, (count, monthly) in sorted(by_currency.items())
+        ) if len(by_currency) > 1 else "")
+        self.check_budget()
+
+    def configure_budget(self):
+        settings = read_settings()
+        self.budget_monitor.configure(
+            float(settings.get("monthly_budget", 0)),
+            settings.get("budget_threshold", 80),
+            settings.get("budget_alert", False)
+        )
+        self.check_budget()
+
+    def check_budget(self):
+        # Partial totals during a load would alert on the way up
+        if self.loader is not None:
+            return
+        monitor = self.budget_monitor
+        current = self.store.aggregates.monthly_total
+        projected = self.store.aggregates.month_bill(month_index(self.subscription_model.today))
+        raised = monitor.check(current, projected)
+        self.budget_gauge.setVisible(monitor.active)
+        if not monitor.active:
+            return
+        self.budget_gauge.setValue(min(int(monitor.usage), 100))
+        self.budget_gauge.setFormat(f"Budget: {monitor.usage:.0f}% of ${monitor.budget:.2f}")
+        self.budget_gauge.setToolTip(f"Monthly average: ${current:.2f}\nBilled this month: ${projected:.2f}")
+        set_style_property(self.budget_gauge, "status", {"ok": "green", "warning": "orange", "over": "red"}[monitor.level])
+        if raised:
+            self.tray_icon.showMessage(
+                "Budget Alert",
+                f"Subscription spending is {'over' if raised == 'over' else 'nearing'} your monthly budget: "
+                f"{monitor.usage:.0f}% of ${monitor.budget:.2f}.",
+                QSystemTrayIcon.MessageIcon.Warning,
+                5000
+            )
+
+    def save_data(self, added=None, updated=None, removed=None):
+        incremental = self.storage.incremental and (added or updated or removed)
+        if self.load_failed and not incremental:
+            # The store only holds what loaded before the failure; a full save would drop the rest
+            return
+        if self.loader is not None:
+            # Writing now would clobber the collection the loader is still reading
+            if incremental:
+                self.pending_changes.extend((op, sub) for op, sub in (("add", added), ("update", updated), ("remove", removed))
+                                            if sub is not None)
+            else:
+                self.save_pending = True
+            return
+        if incremental:
+            for op, sub in (("add", added), ("update", updated), ("remove", removed)):
+                if sub is not None:
+                    self.writer.record_change(op, sub)
+        else:
+            self.writer.save_all(self.store)
+
+    def save_updated(self, subs):
+        """Save edits to many subscriptions.
+
+        Backends with single-record writes get one per subscription; the
+        others get a single full save.
+        """
+        if self.storage.incremental:
+            for sub in subs:
+                self.save_data(updated=sub)
+        elif subs:
+            self.save_data()
 
     def load_data(self):
-        try:
-            if os.path.exists("subscriptions.json"):
-                with open("subscriptions.json", "r") as file:
-                    data = json.load(file)
-                    for sub in data:
-                        if all(key in sub for key in ["name", "renewal_date", "cost", "color", "logo"]):
-                            try:
-                                
-                                cost = float(str(sub["cost"]).replace('$', '').strip())
-                                if cost <= 0:
-                                    continue
-                                    
-                                card = SubscriptionCard(
-                                    name=sub["name"],
-                                    renewal_date=sub["renewal_date"],
-                                    cost=cost,
-                                    color=sub["color"],
-                                    logo=sub.get("logo", DEFAULT_ICON),
-                                    category=sub.get("category", ""),
-                                    on_edit=self.edit_subscription,
-                                    on_delete=self.delete_subscription,
-                                    parent=self
-                                )
-                                self.subscriptions.append(card)
-                                self.scroll_layout.addWidget(card)
-                            except ValueError:
-                                continue
-                                
-                self.update_total_cost()
-                self.stats_widget.update_subscriptions(self.subscriptions)
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to load data: {str(e)}")
+        if not self.storage.exists():
+            return
+        self.loader = SubscriptionLoader(self.storage, parent=self)
+        self.loader.batch_loaded.connect(self.on_subscriptions_loaded)
+        self.loader.progress.connect(self.load_progress.setValue)
+        self.loader.failed.connect(self.on_load_failed)
+        self.loader.finished.connect(self.on_load_finished)
+        self.load_progress.setValue(0)
+        self.load_progress.show()
+        self.loader.start()
+
+    def on_subscriptions_loaded(self, batch):
+        # Renewals that passed while the app was closed move to their next date before indexing
+        rolled = roll_forward(batch, self.subscription_model.today)
+        for sub, day in rolled:
+            sub.renewal_day = day
+        self.save_updated([sub for sub, _ in rolled])
+        if self.filter_proxy.matches is not None:
+            # Filter just the new rows instead of searching everything loaded so far again
+            matches = self.search_query.match(batch, self.subscription_model.today, self.search_fuzzy)
+            self.filter_proxy.add_matches(matches, matches if self.search_fuzzy else None)
+        self.subscription_model.extend_subscriptions(batch)
+        for sub in batch:
+            logo_cache.request(sub.logo, CARD_LOGO_SIZE)
+        self.update_total_cost()
+        self.refresh_stats()
+
+    def on_load_failed(self, message):
+        self.load_failed = True
+        kept = ("Changes to individual subscriptions are still saved." if self.storage.incremental
+                else "Changes made in this session will not be saved.")
+        QMessageBox.warning(self, "Error", f"Failed to load data: {message}\n\n"
+                            f"{self.storage.path} was left untouched. {kept}")
+
+    def on_load_finished(self):
+        startup_timer.mark("load_data")
+        self.maybe_report_startup()
+        self.loader.deleteLater()
+        self.loader = None
+        self.subscription_model.finish_loading()
+        self.load_progress.hide()
+        self.arm_renewal_timer()
+        self.check_budget()
+        changes, self.pending_changes = self.pending_changes, []
+        for op, sub in changes:
+            self.writer.record_change(op, sub)
+        # Only a complete collection may replace the saved one
+        if self.save_pending and not self.load_failed:
+            self.save_data()
+        self.save_pending = False
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if "first paint" not in startup_timer.marks:
+            startup_timer.mark("first paint")
+            self.maybe_report_startup()
+
+    def maybe_report_startup(self):
+        marks = startup_timer.marks
+        if startup_timer.enabled and "first paint" in marks and ("load_data" in marks or self.loader is None):
+            print(startup_timer.report(), file=sys.stderr)
+            startup_timer.enabled = False
+
+    def closeEvent(self, event):
+        if self.loader is not None:
+            # Pending edits can only be saved once the whole collection is in memory
+            self.loader.drain()
+        logo_cache.pool.clear()
+        logo_cache.pool.waitForDone()
+        if self.stats_widget is not None:
+            self.stats_widget.worker.shutdown()
+        self.export_worker.shutdown()
+        self.writer.close()
+        self.storage.close()
+        super().closeEvent(event)
+
+    def arm_rollover_timer(self):
+        # Capped like the renewal timer so suspend or clock changes are caught within the hour
+        delay = min(max(day_start(self.subscription_model.today + 1) - time.time(), 0) + 1, 3600)
+        self.rollover_timer.start(int(delay * 1000))
+
+    def on_day_rollover(self):
+        today = today_ordinal()
+        renewals = self.store.sorted_by("renewal")
+        overdue = renewals.slice(*renewals.range_bounds(None, today, True, False))
+        rolled = roll_forward(overdue, today)
+        for sub, day in rolled:
+            self.subscription_model.update_subscription(sub, renewal_day=day)
+        self.save_updated([sub for sub, _ in rolled])
+        if self.subscription_model.rollover(today) or overdue:
+            self.refresh_search()
+            self.arm_renewal_timer()
+        # A new month bills a different set of subscriptions
+        self.check_budget()
+        self.arm_rollover_timer()
+
+    def configure_reminders(self):
+        settings = read_settings()
+        self.reminders_enabled = settings.get("notifications_enabled", False)
+        lead_days = settings.get("notification_days", 7)
+        if lead_days != self.store.renewals.lead_days:
+            self.store.renewals.set_lead_days(lead_days, self.store)
+        self.arm_renewal_timer()
+
+    def arm_renewal_timer(self):
+        # Reminders wait for the full collection so a load does not produce one per batch
+        if not self.reminders_enabled or self.loader is not None:
+            self.renewal_timer.stop()
+            return
+        due = self.store.renewals.next_due()
+        if due is None:
+            self.renewal_timer.stop()
+            return
+        # Re-check at least hourly so suspend or clock changes cannot delay reminders
+        delay = min(max(due - time.time(), 0), 3600)
+        self.renewal_timer.start(int(delay * 1000))
 
     def check_renewals(self):
-        for card in self.subscriptions:
-            renewal_date = QDate.fromString(card.renewal_date, "yyyy-MM-dd")
-            days_to_renewal = QDate.currentDate().daysTo(renewal_date)
-            if days_to_renewal <= 7:
-                self.tray_icon.showMessage(
-                    "Subscription Renewal Reminder",
-                    f"{card.name} is due for renewal in {days_to_renewal} days.",
-                    QSystemTrayIcon.MessageIcon.Information,
-                    5000
-                )
+        due = self.store.renewals.pop_due(time.time())
+        if len(due) == 1:
+            sub = due[0]
+            days = sub.days_to_renewal()
+            when = "today" if days == 0 else f"in {days} day{'s' if days != 1 else ''}"
+            message = f"{sub.name} is due for renewal {when}."
+        elif due:
+            due.sort(key=lambda sub: sub.renewal_day)
+            names = ", ".join(sub.name for sub in due[:3])
+            more = f" and {len(due) - 3} more" if len(due) > 3 else ""
+            message = f"{len(due)} subscriptions renew within {self.store.renewals.lead_days} days: {names}{more}."
+        if due:
+            self.tray_icon.showMessage(
+                "Subscription Renewal Reminder",
+                message,
+                QSystemTrayIcon.MessageIcon.Information,
+                5000
+            )
+        self.arm_renewal_timer()
 
     def open_settings(self):
         dialog = SettingsDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.update_notification_status()
+            self.configure_reminders()
+            self.configure_budget()
 
     def apply_theme(self, theme):
-        if theme == "dark":
-            self.setStyleSheet("""
-                QMainWindow, QDialog {
-                    background-color: #2C3E50;
-                    color: #ECF0F1;
-                }
-                QLabel {
-                    color: #ECF0F1;
-                }
-                QPushButton {
-                    background-color: #34495E;
-                    color: #ECF0F1;
-                    border: none;
-                    padding: 5px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #415B76;
-                }
-            """)
-        else:
-            self.setStyleSheet("")
+        QApplication.instance().setStyleSheet(theme_stylesheet(theme))
+        self.subscription_delegate.colors = THEMES.get(theme, LIGHT_COLORS)
+        self.list_view.viewport().update()
 
     def load_settings(self):
         try:
@@ -727,48 +1899,59 @@ class MainWindow(QMainWindow):
             self.apply_theme("light")
 
     def show_export_dialog(self):
-        dialog = ExportDialog(self)
-        dialog.exec()
+        if self.loader is not None:
+            QMessageBox.information(self, "Export Data", "Subscriptions are still loading; try again in a moment.")
+            return
+        if self.export_worker.busy():
+            return
+        dialog = ExportDialog(self.search_bar.text().strip(), self)
+        if dialog.exec() != QDialog.DialogCode.Accepted or not dialog.path:
+            return
+        try:
+            text = dialog.query_text()
+            matches = parse_query(text).predicate() if text else None
+        except QueryError as e:
+            QMessageBox.warning(self, "Invalid Query", str(e))
+            return
+        # The worker walks a snapshot of the references, never the live store
+        subs = list(self.store.sorted_by("name"))
+        self.export_progress = QProgressDialog(f"Exporting to {os.path.basename(dialog.path)}...", "Cancel",
+                                               0, max(len(subs), 1), self)
+        self.export_progress.setWindowTitle("Export Data")
+        self.export_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.export_progress.canceled.connect(self.export_worker.cancel)
+        self.export_worker.progress.connect(self.update_export_progress)
+        self.export_action.setEnabled(False)
+        self.export_worker.start(subs, dialog.path, dialog.export_format(), matches)
+
+    def update_export_progress(self, done, total):
+        if self.export_progress is not None:
+            self.export_progress.setValue(done)
+
+    def end_export(self):
+        self.export_worker.progress.disconnect(self.update_export_progress)
+        self.export_action.setEnabled(True)
+        if self.export_progress is not None:
+            self.export_progress.canceled.disconnect(self.export_worker.cancel)
+            self.export_progress.close()
+            self.export_progress.deleteLater()
+            self.export_progress = None
+
+    def on_export_finished(self, path, count):
+        self.end_export()
+        QMessageBox.information(self, "Export Data", f"Exported {count} subscriptions to {path}")
+
+    def on_export_failed(self, message):
+        self.end_export()
+        QMessageBox.critical(self, "Error", f"Failed to export subscriptions: {message}")
+
+    def on_export_cancelled(self):
+        self.end_export()
 
     def sort_subscriptions(self, criteria):
-        try:
-            if criteria == "Name (A-Z)":
-                self.subscriptions.sort(key=lambda x: x.name.lower())
-            elif criteria == "Name (Z-A)":
-                self.subscriptions.sort(key=lambda x: x.name.lower(), reverse=True)
-            elif criteria == "Price (High-Low)":
-                self.subscriptions.sort(key=lambda x: float(x.cost.replace('$', '').strip()), reverse=True)
-            elif criteria == "Price (Low-High)":
-                self.subscriptions.sort(key=lambda x: float(x.cost.replace('$', '').strip()))
-            elif criteria == "Due Soon":
-                
-                self.subscriptions.sort(
-                    key=lambda x: QDate.currentDate().daysTo(QDate.fromString(x.renewal_date, "yyyy-MM-dd"))
-                )
-            elif criteria == "Due Later":
-                
-                self.subscriptions.sort(
-                    key=lambda x: QDate.currentDate().daysTo(QDate.fromString(x.renewal_date, "yyyy-MM-dd")),
-                    reverse=True
-                )
-            elif criteria == "Recently Added":
-               
-                self.subscriptions.sort(key=lambda x: getattr(x, 'date_added', QDate.currentDate()), reverse=True)
-            elif criteria == "Oldest Added":
-                
-                self.subscriptions.sort(key=lambda x: getattr(x, 'date_added', QDate.currentDate()))
-            
-           
-            while self.scroll_layout.count():
-                item = self.scroll_layout.takeAt(0)
-                if item.widget():
-                    item.widget().setParent(None)
-            
-            for card in self.subscriptions:
-                self.scroll_layout.addWidget(card)
-                
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to sort: {str(e)}")
+        if criteria not in SORT_ORDERS:
+            return
+        self.subscription_model.set_sort_order(*SORT_ORDERS[criteria])
             
     def update_notification_status(self):
         try:
@@ -779,12 +1962,10 @@ class MainWindow(QMainWindow):
                 self.notification_status.setText(
                     f"Notifications: {'Enabled' if enabled else 'Disabled'} ({days} days before renewal)"
                 )
-                self.notification_status.setStyleSheet(
-                    f"color: {'green' if enabled else 'red'}; padding: 5px;"
-                )
+                set_style_property(self.notification_status, "status", "green" if enabled else "red")
         except:
             self.notification_status.setText("Notifications: Not configured")
-            self.notification_status.setStyleSheet("color: orange; padding: 5px;")
+            set_style_property(self.notification_status, "status", "orange")
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
@@ -813,7 +1994,9 @@ class SettingsDialog(QDialog):
             "show_all_periods": False,
             "highlight_expensive": False,
             "expense_threshold": 50,
-            "cost_period": "Monthly"
+            "cost_period": "Monthly",
+            "storage_backend": "JSON",
+            "binary_snapshot": True
         }
         
         scroll = QScrollArea()
@@ -899,6 +2082,12 @@ class SettingsDialog(QDialog):
         backup_layout.addWidget(QLabel("Location:"))
         backup_layout.addWidget(self.backup_location)
         backup_layout.addWidget(browse_button)
+        self.storage_backend = QComboBox()
+        self.storage_backend.addItems(STORAGE_BACKENDS)
+        backup_layout.addWidget(QLabel("Storage (applies after restart):"))
+        backup_layout.addWidget(self.storage_backend)
+        self.binary_snapshot = QCheckBox("Keep binary snapshot for faster startup")
+        backup_layout.addWidget(self.binary_snapshot)
         backup_group.setLayout(backup_layout)
 
        
@@ -987,6 +2176,8 @@ class SettingsDialog(QDialog):
             self.highlight_expensive.setChecked(settings.get("highlight_expensive", False))
             self.expense_threshold.setValue(settings.get("expense_threshold", 50))
             self.cost_period.setCurrentText(settings.get("cost_period", "Monthly"))
+            self.storage_backend.setCurrentText(settings.get("storage_backend", "JSON"))
+            self.binary_snapshot.setChecked(settings.get("binary_snapshot", True))
             
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load settings: {str(e)}")
@@ -1015,46 +2206,161 @@ class SettingsDialog(QDialog):
                 "show_all_periods": self.show_all_periods.isChecked(),
                 "highlight_expensive": self.highlight_expensive.isChecked(),
                 "expense_threshold": self.expense_threshold.value(),
-                "cost_period": self.cost_period.currentText()
+                "cost_period": self.cost_period.currentText(),
+                "storage_backend": self.storage_backend.currentText(),
+                "binary_snapshot": self.binary_snapshot.isChecked()
             }
             
-            with open("settings.json", "w") as f:
-                json.dump(settings, f, indent=4)
+            write_settings(settings)
             QMessageBox.information(self, "Success", "Settings saved successfully!")
             self.accept()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
 
+class CheckableSubscriptionModel(QAbstractListModel):
+    """Checkable list of subscriptions whose check states live in one bitset.
+
+    Bulk changes flip a NumPy boolean mask and emit a single ``dataChanged``
+    spanning the rows, plus one ``selection_changed``, however many rows
+    they touch.
+    """
+    selection_changed = pyqtSignal()
+
+    def __init__(self, subscriptions, selected=(), parent=None):
+        super().__init__(parent)
+        self.subscriptions = list(subscriptions)
+        self.rows = {sub: row for row, sub in enumerate(self.subscriptions)}
+        self.checked = np.zeros(len(self.subscriptions), dtype=bool)
+        self.checked[[self.rows[sub] for sub in selected if sub in self.rows]] = True
+        self._category_codes = None
+        # Subscriptions let through by SubscriptionFilterProxy, or None without a filter
+        self.matches = None
+
+    def subscription_at(self, row):
+        return self.subscriptions[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.subscriptions)
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            sub = self.subscriptions[index.row()]
+            return f"{sub.name} (${sub.cost:.2f}/{period_label(sub.frequency)})"
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self.checked[index.row()] else Qt.CheckState.Unchecked
+        if role == SubscriptionFilterProxy.MatchRole:
+            return self.matches is not None and self.subscriptions[index.row()] in self.matches
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole or not index.isValid():
+            return False
+        self.checked[index.row()] = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [role])
+        self.selection_changed.emit()
+        return True
+
+    def _changed(self):
+        if len(self.subscriptions):
+            self.dataChanged.emit(self.index(0), self.index(len(self.subscriptions) - 1),
+                                  [Qt.ItemDataRole.CheckStateRole])
+        self.selection_changed.emit()
+
+    def rows_mask(self, subs):
+        mask = np.zeros(len(self.subscriptions), dtype=bool)
+        mask[[self.rows[sub] for sub in subs if sub in self.rows]] = True
+        return mask
+
+    def category_mask(self, category):
+        if self._category_codes is None:
+            categories = {}
+            self._category_codes = (np.fromiter(
+                (categories.setdefault(sub.category, len(categories)) for sub in self.subscriptions),
+                dtype=np.int64, count=len(self.subscriptions)), categories)
+        codes, categories = self._category_codes
+        return codes == categories.get(category, -1)
+
+    def set_checked(self, mask, checked):
+        """Check or uncheck the rows in ``mask`` (every row when it is None)."""
+        self.checked[slice(None) if mask is None else mask] = checked
+        self._changed()
+
+    def invert(self, mask=None):
+        if mask is None:
+            np.logical_not(self.checked, out=self.checked)
+        else:
+            self.checked[mask] = ~self.checked[mask]
+        self._changed()
+
+    def checked_count(self):
+        return int(np.count_nonzero(self.checked))
+
+    def checked_subscriptions(self):
+        return [self.subscriptions[row] for row in np.flatnonzero(self.checked).tolist()]
+
 class SelectSubscriptionsDialog(QDialog):
-    def __init__(self, subscriptions, parent=None):
+    def __init__(self, subscriptions, parent=None, selected=()):
         super().__init__(parent)
         self.setWindowTitle("Select Subscriptions")
         self.setFixedSize(400, 500)
         
         layout = QVBoxLayout()
+        self.subscriptions = subscriptions
         
-       
-        self.subscription_list = QListWidget()
-        for sub in subscriptions:
-            item = QListWidgetItem()
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            item.setText(f"{sub.name} (${float(sub.cost):.2f}/month)")
-            item.setData(Qt.ItemDataRole.UserRole, sub)
-            self.subscription_list.addItem(item)
+        self.model = CheckableSubscriptionModel(subscriptions, selected, self)
+        self.subscription_list = QListView()
+        self.subscription_list.setUniformItemSizes(True)
+        self.filter_proxy = SubscriptionFilterProxy(self.model, self)
+        self.subscription_list.setModel(self.filter_proxy)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter, e.g. spotify or category:Music cost>10")
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.filter_input.textChanged.connect(self.filter_timer.start)
+        self.visible_mask = None
             
         
         buttons_layout = QHBoxLayout()
         select_all = QPushButton("Select All")
         deselect_all = QPushButton("Deselect All")
+        invert = QPushButton("Invert")
         select_all.clicked.connect(self.select_all)
         deselect_all.clicked.connect(self.deselect_all)
+        invert.clicked.connect(self.invert_selection)
         buttons_layout.addWidget(select_all)
         buttons_layout.addWidget(deselect_all)
+        buttons_layout.addWidget(invert)
+
+        self.category_select = QComboBox()
+        self.category_select.addItem("Select category...")
+        self.category_select.addItems(sorted({sub.category or "Uncategorized" for sub in self.model.subscriptions}))
+        self.category_select.activated.connect(self.select_category)
+        query_button = QPushButton("Select by Query")
+        query_menu = QMenu(query_button)
+        query_menu.aboutToShow.connect(lambda: populate_saved_queries_menu(query_menu, self.select_by_query))
+        query_button.setMenu(query_menu)
+        by_layout = QHBoxLayout()
+        by_layout.addWidget(self.category_select)
+        by_layout.addWidget(query_button)
+
+        self.count_label = QLabel()
+        self.model.selection_changed.connect(self.update_count)
+        self.update_count()
         
         
+        layout.addWidget(self.filter_input)
         layout.addLayout(buttons_layout)
+        layout.addLayout(by_layout)
         layout.addWidget(self.subscription_list)
+        layout.addWidget(self.count_label)
         
         
         button_box = QDialogButtonBox(
@@ -1066,25 +2372,62 @@ class SelectSubscriptionsDialog(QDialog):
         layout.addWidget(button_box)
         
         self.setLayout(layout)
+
+    def matching(self, text):
+        query = parse_query(text)
+        if hasattr(self.subscriptions, "sorted_by"):
+            return query.evaluate(self.subscriptions)
+        matches = query.predicate()
+        return {sub for sub in self.model.subscriptions if matches(sub)}
+
+    def apply_filter(self):
+        self.filter_timer.stop()
+        text = self.filter_input.text().strip()
+        try:
+            matches = self.matching(text) if text else None
+        except QueryError as e:
+            set_style_property(self.filter_input, "invalid", True)
+            self.filter_input.setToolTip(str(e))
+            return
+        set_style_property(self.filter_input, "invalid", False)
+        self.filter_input.setToolTip("")
+        self.filter_proxy.set_matches(matches)
+        # Bulk actions only touch the rows left visible by the filter
+        self.visible_mask = None if matches is None else self.model.rows_mask(matches)
+
+    def update_count(self):
+        self.count_label.setText(f"{self.model.checked_count()} of {len(self.model.subscriptions)} selected")
     
     def select_all(self):
-        for i in range(self.subscription_list.count()):
-            self.subscription_list.item(i).setCheckState(Qt.CheckState.Checked)
+        self.model.set_checked(self.visible_mask, True)
             
     def deselect_all(self):
-        for i in range(self.subscription_list.count()):
-            self.subscription_list.item(i).setCheckState(Qt.CheckState.Unchecked)
+        self.model.set_checked(self.visible_mask, False)
+
+    def invert_selection(self):
+        self.model.invert(self.visible_mask)
+
+    def select_category(self, index):
+        if index <= 0:
+            return
+        category = self.category_select.itemText(index)
+        self.model.set_checked(self.model.category_mask("" if category == "Uncategorized" else category), True)
+        self.category_select.setCurrentIndex(0)
+
+    def select_by_query(self, text):
+        try:
+            matches = self.matching(text)
+        except QueryError as e:
+            QMessageBox.warning(self, "Invalid Query", str(e))
+            return
+        self.model.set_checked(self.model.rows_mask(matches), True)
             
     def get_selected_subscriptions(self):
-        selected = []
-        for i in range(self.subscription_list.count()):
-            item = self.subscription_list.item(i)
-            if item.checkState() == Qt.CheckState.Checked:
-                selected.append(item.data(Qt.ItemDataRole.UserRole))
-        return selected
+        return self.model.checked_subscriptions()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = MainWindow()
+    startup_timer.mark("window build")
     window.show()
     sys.exit(app.exec())
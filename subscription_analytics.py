@@ -0,0 +1,122 @@
+"""Analytics computed away from the GUI thread.
+
+The GUI takes an ``AnalyticsRequest`` snapshot: the subscriptions
+involved, a frozen copy of the aggregates and the view settings.
+``compute_analytics`` turns it into an ``AnalyticsResult`` whose parts
+are tuples and read-only arrays, ready to be drawn. ``cancelled`` is
+polled between stages so a superseded request stops early.
+"""
+from datetime import datetime
+
+from subscription_chartdata import fold_top_n, lttb, unique_labels
+from subscription_forecast import forecast
+from subscription_recurrence import normalized_costs
+
+
+class AnalyticsRequest:
+    __slots__ = ("selection", "subscriptions", "aggregates", "top_n", "horizon", "today", "line_points",
+                 "graph", "forecast")
+
+    def __init__(self, selection, subscriptions, aggregates, top_n, horizon, today, line_points, graph, forecast):
+        self.selection = selection
+        self.subscriptions = subscriptions
+        self.aggregates = aggregates
+        self.top_n = top_n
+        self.horizon = horizon
+        self.today = today
+        self.line_points = line_points
+        self.graph = graph
+        self.forecast = forecast
+
+
+class BarChartData:
+    __slots__ = ("labels", "values", "scale", "count", "text")
+
+    def __init__(self, labels, values, scale, count, text):
+        values.setflags(write=False)
+        self.labels = tuple(labels)
+        self.values = values
+        self.scale = scale
+        self.count = count
+        self.text = text
+
+
+class ForecastChartData:
+    __slots__ = ("forecast", "series", "scale", "summary")
+
+    def __init__(self, forecast, series, scale, summary):
+        self.forecast = forecast
+        # ((name, ((x, y), ...)), ...) with x in milliseconds since the epoch
+        self.series = series
+        self.scale = scale
+        self.summary = summary
+
+
+class AnalyticsResult:
+    __slots__ = ("bars", "forecast")
+
+    def __init__(self, bars, forecast):
+        self.bars = bars
+        self.forecast = forecast
+
+
+def collection_summary(aggregates):
+    if aggregates is None or not aggregates.count:
+        return "No subscriptions yet."
+    lines = [
+        f"All Subscriptions: {aggregates.count}",
+        f"Monthly Total: ${aggregates.monthly_total:.2f}",
+        f"Yearly Total: ${aggregates.monthly_total * 12:.2f}"
+    ]
+    for title, groups in (("By category", aggregates.by_category), ("By currency", aggregates.by_currency),
+                          ("By billing period", aggregates.by_frequency)):
+        lines.append(f"\n{title}:")
+        for key, (count, monthly) in sorted(groups.items(), key=lambda item: -item[1][1]):
+            lines.append(f"  {key or 'Uncategorized'}: {count} — ${monthly:.2f}/month")
+    return "\n".join(lines)
+
+
+def bar_chart_data(selection, top_n, aggregates):
+    if not selection:
+        return BarChartData((), normalized_costs(()), 1, 0, collection_summary(aggregates))
+    costs = normalized_costs(selection)
+    labels, values = fold_top_n([sub.name for sub in selection], costs, top_n)
+    # Large totals are plotted in thousands so axis labels stay narrow
+    scale = 1000 if values.max() >= 10000 else 1
+    total = float(costs.sum())
+    text = "\n".join((
+        "Selected Subscriptions Summary:",
+        f"Monthly Total: ${total:.2f}",
+        f"Yearly Total: ${total * 12:.2f}",
+        f"Number of Subscriptions: {len(selection)}"
+    ))
+    return BarChartData(unique_labels(labels), values / scale, scale, len(selection), text)
+
+
+def forecast_chart_data(subscriptions, horizon, today, line_points):
+    result = forecast(subscriptions, horizon, today)
+    months = [datetime(month.year, month.month, 1).timestamp() * 1000 for month in result.months.astype(object)]
+    scale = 1000 if result.total >= 10000 else 1
+    series = []
+    for name, values in (("Per month", result.per_month), ("Cumulative", result.cumulative)):
+        keep = lttb(months, values, line_points).tolist()
+        series.append((name, tuple((months[i], float(values[i]) / scale) for i in keep)))
+    top = list(result.category_totals().items())[:5]
+    breakdown = ", ".join(f"{category or 'Uncategorized'} ${total:,.2f}" for category, total in top)
+    summary = (f"Projected spend over {len(months)} months: ${result.total:,.2f}"
+               + (f"\nBy category: {breakdown}" if breakdown else ""))
+    return ForecastChartData(result, tuple(series), scale, summary)
+
+
+def compute_analytics(request, cancelled=lambda: False):
+    """Build the result for ``request``; None if ``cancelled()`` turned true along the way."""
+    bars = forecast_data = None
+    if request.graph:
+        bars = bar_chart_data(request.selection, request.top_n, request.aggregates)
+    if cancelled():
+        return None
+    if request.forecast:
+        forecast_data = forecast_chart_data(request.subscriptions, request.horizon, request.today, request.line_points)
+    if cancelled():
+        return None
+    return AnalyticsResult(bars, forecast_data)
@@ -0,0 +1,59 @@
+"""Budget alerts with hysteresis.
+
+``BudgetMonitor`` turns the current spend into a level: ``"ok"``,
+``"warning"`` at ``threshold`` percent of the budget, or ``"over"`` at the
+full budget. Falling back to a lower level needs the usage to drop
+``hysteresis`` points below the boundary. Spend hovering around a
+boundary therefore cannot alert again on every edit. Each check is O(1);
+callers pass in totals that are already maintained incrementally.
+"""
+
+LEVELS = ("ok", "warning", "over")
+
+
+class BudgetMonitor:
+    def __init__(self, budget=0.0, threshold=80, enabled=False, hysteresis=5):
+        self.budget = budget
+        self.threshold = threshold
+        self.enabled = enabled
+        self.hysteresis = hysteresis
+        self.level = "ok"
+        self.usage = 0.0
+
+    def configure(self, budget, threshold, enabled):
+        if (budget, threshold) != (self.budget, self.threshold):
+            # Re-evaluated from scratch so a new budget alerts straight away
+            self.level = "ok"
+        self.budget = budget
+        self.threshold = threshold
+        self.enabled = enabled
+
+    @property
+    def active(self):
+        return self.budget > 0
+
+    def _boundaries(self):
+        return {"warning": self.threshold, "over": 100}
+
+    def check(self, current, projected):
+        """Update the level for the given monthly spends.
+
+        Returns the new level when it rose and alerts are enabled, else None.
+        """
+        if not self.active:
+            self.level, self.usage = "ok", 0.0
+            return None
+        self.usage = max(current, projected) * 100 / self.budget
+        boundaries = self._boundaries()
+        rank = LEVELS.index(self.level)
+        # Rise to the highest level reached; fall only past the hysteresis band
+        raised = rank
+        while raised + 1 < len(LEVELS) and self.usage >= boundaries[LEVELS[raised + 1]]:
+            raised += 1
+        if raised > rank:
+            self.level = LEVELS[raised]
+            return self.level if self.enabled else None
+        while rank > 0 and self.usage < boundaries[LEVELS[rank]] - self.hysteresis:
+            rank -= 1
+        self.level = LEVELS[rank]
+        return None
@@ -0,0 +1,107 @@
+"""Catalog of well-known providers offered when adding a subscription.
+
+The catalog lives in ``catalog.json`` and is parsed the first time it is
+needed. ``Catalog.search`` answers type-ahead queries from a sorted token
+table: every word of a query is matched as a prefix of some word in the
+entry name or category, so "am mus" finds "Amazon Music".
+"""
+import bisect
+import json
+import re
+from functools import lru_cache
+
+from subscription_core import LOGO_DIR, DEFAULT_ICON, parse_cost
+
+
+CATALOG_FILE = "catalog.json"
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def tokens(text):
+    return _WORD.findall(text.lower())
+
+
+class CatalogEntry:
+    __slots__ = ("name", "color", "logo", "category", "cost", "frequency")
+
+    def __init__(self, name, color, logo, category="", cost=0.0, frequency="Monthly"):
+        self.name = name
+        self.color = color
+        self.logo = logo
+        self.category = category
+        self.cost = cost
+        self.frequency = frequency
+
+    @classmethod
+    def from_record(cls, record):
+        logo = record.get("logo")
+        return cls(
+            name=record["name"],
+            color=record.get("color", "#4F46E5"),
+            logo=str(LOGO_DIR / logo) if logo else DEFAULT_ICON,
+            category=record.get("category", ""),
+            cost=parse_cost(record.get("cost", 0.0)),
+            frequency=record.get("frequency", "Monthly"),
+        )
+
+
+class Catalog:
+    def __init__(self, entries=()):
+        self.entries = sorted(entries, key=lambda entry: entry.name.lower())
+        # (token, entry id) pairs, sorted so a prefix is one bisect away
+        self._tokens = sorted({
+            (token, entry_id)
+            for entry_id, entry in enumerate(self.entries)
+            for token in tokens(entry.name) + tokens(entry.category)
+        })
+        self._keys = [token for token, _ in self._tokens]
+        self._by_name = {entry.name.lower(): entry for entry in self.entries}
+
+    @classmethod
+    def load(cls, path=CATALOG_FILE):
+        """Read a catalog file; a missing or unreadable file gives an empty catalog."""
+        try:
+            with open(path, encoding="utf-8") as file:
+                records = json.load(file)
+        except (OSError, ValueError):
+            return cls()
+        return cls(CatalogEntry.from_record(record) for record in records if record.get("name"))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getitem__(self, entry_id):
+        return self.entries[entry_id]
+
+    def find(self, name):
+        """Return the entry named exactly ``name`` (case-insensitive), or None."""
+        return self._by_name.get(name.lower())
+
+    def _prefixed(self, prefix):
+        start = bisect.bisect_left(self._keys, prefix)
+        stop = bisect.bisect_left(self._keys, prefix + "\uffff", start)
+        return {entry_id for _, entry_id in self._tokens[start:stop]}
+
+    def search(self, text):
+        """Return the ids of entries matching every word of ``text``, best first.
+
+        Names starting with the query come first; the rest keep catalog
+        (alphabetical) order.
+        """
+        words = tokens(text)
+        if not words:
+            return list(range(len(self.entries)))
+        matches = None
+        for word in sorted(words, key=len, reverse=True):
+            found = self._prefixed(word)
+            matches = found if matches is None else matches & found
+            if not matches:
+                return []
+        query = text.strip().lower()
+        return sorted(matches, key=lambda entry_id: (not self.entries[entry_id].name.lower().startswith(query), entry_id))
+
+
+@lru_cache(maxsize=None)
+def get_catalog(path=CATALOG_FILE):
+    return Catalog.load(path)
@@ -0,0 +1,57 @@
+"""Shapes data for charts so they stay readable and cheap to draw.
+
+Bar charts keep the ``n`` largest values and fold the long tail into one
+"Other" entry. Line charts are thinned with Largest-Triangle-Three-Buckets
+(LTTB), which keeps the points that define the curve's shape.
+"""
+import numpy as np
+
+
+def fold_top_n(labels, values, n):
+    """Return ``(labels, values)`` for the ``n`` largest values plus an "Other" entry, largest first."""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) <= n:
+        order = np.argsort(-values, kind="stable")
+        return [labels[i] for i in order], values[order]
+    top = np.argpartition(-values, n - 1)[:n]
+    top = top[np.argsort(-values[top], kind="stable")]
+    rest = np.ones(len(values), dtype=bool)
+    rest[top] = False
+    return ([labels[i] for i in top] + [f"Other ({rest.sum()})"],
+            np.append(values[top], values[rest].sum()))
+
+
+def unique_labels(labels):
+    """Suffix repeated labels with a counter; category axes need distinct names."""
+    seen = {}
+    result = []
+    for label in labels:
+        count = seen[label] = seen.get(label, 0) + 1
+        result.append(label if count == 1 else f"{label} ({count})")
+    return result
+
+
+def lttb(x, y, threshold):
+    """Indices of at most ``threshold`` points that best preserve the shape of ``(x, y)``."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+    every = (length - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    previous = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        stop = int((bucket + 1) * every) + 1
+        next_stop = min(int((bucket + 2) * every) + 1, length)
+        # The triangle's third corner is the average of the following bucket
+        average_x = x[stop:next_stop].mean()
+        average_y = y[stop:next_stop].mean()
+        areas = np.abs((x[previous] - average_x) * (y[start:stop] - y[previous])
+                       - (x[previous] - x[start:stop]) * (average_y - y[previous]))
+        previous = start + int(areas.argmax())
+        selected[bucket + 1] = previous
+    selected[-1] = length - 1
+    return selected
@@ -0,0 +1,502 @@
+"""Headless subscription data model.
+
+Nothing in this module imports PyQt6, so subscriptions can be loaded,
+queried and aggregated without building a single widget. The GUI in
+``subscription.py`` renders from a ``SubscriptionStore``.
+"""
+import bisect
+import json
+import math
+import mmap
+import os
+import stat
+import sys
+import tempfile
+import time
+import zlib
+from datetime import date
+from operator import attrgetter
+
+from subscription_recurrence import period_months
+from subscription_reminders import RenewalScheduler
+from subscription_search import SearchIndex
+from pathlib import Path
+
+
+LOGO_DIR = Path("logos")
+DEFAULT_ICON = str(LOGO_DIR / "default_logo.png")
+DATA_FILE = "subscriptions.json"
+
+REQUIRED_KEYS = ("name", "renewal_date", "cost", "color", "logo")
+
+
+def parse_cost(value):
+    """Turn a stored cost such as ``9.99``, ``"9.99"`` or ``"$9.99"`` into a float."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float(str(value).replace('$', '').strip())
+
+
+def parse_day(value):
+    """Return the ordinal day for a ``yyyy-MM-dd`` string (ints pass through)."""
+    if isinstance(value, int):
+        return value
+    return date.fromisoformat(value).toordinal()
+
+
+def format_day(day):
+    return date.fromordinal(day).isoformat()
+
+
+def today_ordinal():
+    return date.today().toordinal()
+
+
+def month_index(day):
+    """Months since year 0 for an ordinal day, so consecutive months differ by one."""
+    day = date.fromordinal(day)
+    return day.year * 12 + day.month - 1
+
+
+_NO_VALUE = object()
+
+
+def iter_json_array(file, chunk_size=64 * 1024):
+    """Yield the elements of a top-level JSON array while reading ``file`` in chunks.
+
+    Only the current chunk and the element being decoded are held in memory,
+    so arbitrarily large files can be consumed incrementally.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    in_array = False
+    eof = False
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos < len(buffer):
+            if not in_array:
+                if buffer[pos] != "[":
+                    raise ValueError("Expected a JSON array")
+                in_array = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                value = _NO_VALUE
+            if value is not _NO_VALUE:
+                # Only trust a value once its delimiter is buffered; a number
+                # cut at a chunk boundary would otherwise decode short
+                delimiter = end
+                while delimiter < len(buffer) and buffer[delimiter] in " \t\r\n":
+                    delimiter += 1
+                if delimiter < len(buffer) and buffer[delimiter] in ",]":
+                    yield value
+                    pos = end
+                    continue
+                if eof:
+                    raise ValueError("Malformed JSON array")
+        elif eof:
+            if in_array:
+                raise ValueError("Unterminated JSON array")
+            return
+        chunk = file.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+# os.umask can only be read by setting it, which would race with other
+# threads creating files, so it is read once on import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write(path, write, *args):
+    """Call ``write(temp_path, *args)`` on a temp file next to ``path``, then rename it into place.
+
+    A crash or exception mid-write leaves the previous file untouched. The
+    temp file takes the mode of the file it replaces, or the umask default
+    for a new one, rather than ``mkstemp``'s owner-only 0600.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}-", suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp_path, mode)
+        write(temp_path, *args)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_json(path, subs):
+    """Stream ``subs`` to ``path`` as a JSON array and sync it to disk."""
+    with open(path, "w") as file:
+        file.write("[")
+        separator = "\n    "
+        for sub in subs:
+            file.write(separator)
+            file.write(json.dumps(sub.to_dict()))
+            separator = ",\n    "
+        file.write("\n]\n")
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def write_bytes(path, *chunks):
+    with open(path, "wb") as file:
+        for chunk in chunks:
+            file.write(chunk)
+
+
+def open_mapped(path, header, magic, version, accept=lambda fields, size: True):
+    """Memory-map a little-endian file laid out as ``header`` followed by a body.
+
+    ``header`` is a ``struct.Struct`` whose first fields are the magic and
+    version and whose last is the CRC-32 of the body; ``accept(fields,
+    body size)`` can reject the file on its other header fields. Returns
+    ``(file, mapped)``, or None when the file is missing or fails a check.
+    """
+    if sys.byteorder != "little":
+        return None
+    try:
+        file = open(path, "rb")
+    except OSError:
+        return None
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        file.close()
+        return None
+    if _mapped_valid(mapped, header, magic, version, accept):
+        return file, mapped
+    mapped.close()
+    file.close()
+    return None
+
+
+def _mapped_valid(mapped, header, magic, version, accept):
+    if len(mapped) < header.size:
+        return False
+    fields = header.unpack_from(mapped)
+    if fields[0] != magic or fields[1] != version or not accept(fields, len(mapped) - header.size):
+        return False
+    with memoryview(mapped) as view:
+        return zlib.crc32(view[header.size:]) == fields[-1]
+
+
+def iter_subscriptions(file):
+    """Stream valid subscriptions out of a JSON file, skipping bad records."""
+    for record in iter_json_array(file):
+        try:
+            yield Subscription.from_dict(record)
+        except (ValueError, AttributeError):
+            continue
+
+
+class Subscription:
+    __slots__ = ("id", "name", "renewal_day", "cost", "color", "logo", "category", "currency", "frequency", "added")
+
+    def __init__(self, name, renewal_date, cost, color, logo, category="", currency="USD", frequency="Monthly",
+                 added=None):
+        # Row id assigned by a storage backend that addresses records individually
+        self.id = None
+        self.name = name
+        self.renewal_day = parse_day(renewal_date)
+        self.cost = parse_cost(cost)
+        self.color = color
+        self.logo = logo
+        self.category = category
+        self.currency = currency
+        self.frequency = frequency
+        # Unix timestamp of when the subscription was first added
+        self.added = time.time() if added is None else float(added)
+
+    @property
+    def renewal_date(self):
+        return format_day(self.renewal_day)
+
+    @renewal_date.setter
+    def renewal_date(self, value):
+        self.renewal_day = parse_day(value)
+
+    def days_to_renewal(self, today=None):
+        return self.renewal_day - (today_ordinal() if today is None else today)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "renewal_date": self.renewal_date,
+            "cost": self.cost,
+            "color": self.color,
+            "logo": self.logo,
+            "category": self.category,
+            "currency": self.currency,
+            "frequency": self.frequency,
+            "added": self.added
+        }
+
+    @classmethod
+    def from_dict(cls, record):
+        """Build a subscription from a saved record.
+
+        Raises ``ValueError`` for records that are incomplete, malformed or
+        have a non-positive cost, matching what the loader used to skip.
+        """
+        if not all(key in record for key in REQUIRED_KEYS):
+            raise ValueError("Incomplete subscription record")
+        try:
+            sub = cls(
+                name=record["name"],
+                renewal_date=record["renewal_date"],
+                cost=record["cost"],
+                color=record["color"],
+                logo=record.get("logo") or DEFAULT_ICON,
+                category=record.get("category", ""),
+                currency=record.get("currency", "USD"),
+                frequency=record.get("frequency", "Monthly"),
+                # Records saved before timestamps existed sort as oldest, in file order
+                added=record.get("added", 0.0)
+            )
+        except TypeError as e:
+            raise ValueError(str(e))
+        if not sub.cost > 0:
+            raise ValueError("Subscription cost must be positive")
+        return sub
+
+    def __repr__(self):
+        return f"Subscription({self.name!r}, {self.renewal_date!r}, {self.cost!r})"
+
+
+SORT_KEYS = {
+    "name": lambda sub: sub.name.lower(),
+    "cost": attrgetter("cost"),
+    "renewal": attrgetter("renewal_day"),
+    "added": attrgetter("added")
+}
+
+
+class SortedIndex:
+    """Subscriptions kept in order of a sort key cached when they are indexed.
+
+    Entries are ``(key, seq, sub)``; the unique ``seq`` breaks ties by
+    insertion order and stops comparisons from ever reaching ``sub``.
+    Single inserts and removals are a bisect; bulk ``extend`` is deferred
+    and merged with one sort on the next read.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self._entries = []
+        self._entry_for = {}
+        self._pending = []
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._entries) + len(self._pending)
+
+    def __getitem__(self, position):
+        self._merge_pending()
+        return self._entries[position][2]
+
+    def __iter__(self):
+        self._merge_pending()
+        return (entry[2] for entry in self._entries)
+
+    def _entry(self, sub):
+        self._seq += 1
+        entry = self._entry_for[sub] = (self.key(sub), self._seq, sub)
+        return entry
+
+    def _merge_pending(self):
+        if self._pending:
+            self._entries.extend(self._pending)
+            self._pending = []
+            self._entries.sort()
+
+    def extend(self, subs):
+        self._pending.extend(self._entry(sub) for sub in subs)
+
+    def insert(self, sub):
+        self._merge_pending()
+        bisect.insort(self._entries, self._entry(sub))
+
+    def insert_position(self, sub):
+        """Position ``sub`` would take if inserted now."""
+        self._merge_pending()
+        return bisect.bisect_right(self._entries, (self.key(sub), math.inf))
+
+    def position(self, sub):
+        self._merge_pending()
+        return bisect.bisect_left(self._entries, self._entry_for[sub])
+
+    def remove(self, sub):
+        self._merge_pending()
+        entry = self._entry_for.pop(sub)
+        del self._entries[bisect.bisect_left(self._entries, entry)]
+
+    def range_bounds(self, low=None, high=None, include_low=True, include_high=True):
+        """Positions ``[start, stop)`` of the entries whose key lies between the bounds."""
+        self._merge_pending()
+        entries = self._entries
+        if low is None:
+            start = 0
+        elif include_low:
+            start = bisect.bisect_left(entries, (low,))
+        else:
+            start = bisect.bisect_right(entries, (low, math.inf))
+        if high is None:
+            stop = len(entries)
+        elif include_high:
+            stop = bisect.bisect_right(entries, (high, math.inf))
+        else:
+            stop = bisect.bisect_left(entries, (high,))
+        return start, max(start, stop)
+
+    def slice(self, start, stop):
+        self._merge_pending()
+        return [entry[2] for entry in self._entries[start:stop]]
+
+
+class Aggregates:
+    """Running counts and monthly-normalised totals, overall and per group.
+
+    Groups are keyed by category, currency and billing frequency and map to
+    ``[count, monthly total]``. ``by_phase`` groups actual charges by
+    ``(period in months, renewal month % period)`` so the bill for any
+    calendar month is a sum over the few billing periods in use. Every add
+    or remove adjusts them in O(1); a group is dropped once its count
+    reaches zero, which also discards any floating-point residue from the
+    subtractions.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.monthly_total = 0.0
+        self.by_category = {}
+        self.by_currency = {}
+        self.by_frequency = {}
+        self.by_phase = {}
+
+    def _apply(self, sub, sign):
+        months = period_months(sub.frequency)
+        monthly = sign * sub.cost / months
+        self.count += sign
+        self.monthly_total = self.monthly_total + monthly if self.count else 0.0
+        for groups, key, amount in ((self.by_category, sub.category, monthly),
+                                    (self.by_currency, sub.currency, monthly),
+                                    (self.by_frequency, sub.frequency, monthly),
+                                    (self.by_phase, (months, month_index(sub.renewal_day) % months), sign * sub.cost)):
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = [0, 0.0]
+            group[0] += sign
+            group[1] += amount
+            if not group[0]:
+                del groups[key]
+
+    def add(self, sub):
+        self._apply(sub, 1)
+
+    def remove(self, sub):
+        self._apply(sub, -1)
+
+    def extend(self, subs):
+        for sub in subs:
+            self._apply(sub, 1)
+
+    def snapshot(self):
+        """Copy of the current totals that later mutations do not touch."""
+        copy = Aggregates.__new__(Aggregates)
+        copy.count = self.count
+        copy.monthly_total = self.monthly_total
+        for name in ("by_category", "by_currency", "by_frequency", "by_phase"):
+            setattr(copy, name, {key: tuple(group) for key, group in getattr(self, name).items()})
+        return copy
+
+    def month_bill(self, month):
+        """Total charged in calendar month ``month`` (see ``month_index``)."""
+        return sum(group[1] for (months, phase), group in self.by_phase.items() if month % months == phase)
+
+
+class SubscriptionStore:
+    """Owns the collection of subscriptions and keeps it indexed for sorting.
+
+    Iteration yields subscriptions in insertion order; ``sorted_by`` returns
+    a ``SortedIndex`` for one of the ``SORT_KEYS``, ``search`` is a text
+    index over names and categories, ``renewals`` schedules renewal
+    reminders and ``aggregates`` keeps running totals. All of them are
+    maintained on every add, update and remove.
+    """
+
+    def __init__(self, subscriptions=None):
+        self._subscriptions = {}
+        self._indexes = {field: SortedIndex(key) for field, key in SORT_KEYS.items()}
+        self.search = SearchIndex()
+        self.renewals = RenewalScheduler()
+        self.aggregates = Aggregates()
+        if subscriptions:
+            self.extend(subscriptions)
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def __iter__(self):
+        return iter(self._subscriptions)
+
+    def __contains__(self, sub):
+        return sub in self._subscriptions
+
+    def sorted_by(self, field):
+        return self._indexes[field]
+
+    def add(self, sub):
+        self._subscriptions[sub] = None
+        self.attach(sub)
+
+    def extend(self, subs):
+        subs = list(subs)
+        self._subscriptions.update(dict.fromkeys(subs))
+        for index in self._indexes.values():
+            index.extend(subs)
+        self.search.extend(subs)
+        self.renewals.extend(subs)
+        self.aggregates.extend(subs)
+
+    def remove(self, sub):
+        del self._subscriptions[sub]
+        self.detach(sub)
+        self.renewals.forget(sub)
+
+    def detach(self, sub):
+        """Take ``sub`` out of the indexes before its fields change."""
+        for index in self._indexes.values():
+            index.remove(sub)
+        self.search.remove(sub)
+        self.renewals.unschedule(sub)
+        self.aggregates.remove(sub)
+
+    def attach(self, sub):
+        """Re-index ``sub`` under its current field values."""
+        for index in self._indexes.values():
+            index.insert(sub)
+        self.search.add(sub)
+        self.renewals.schedule(sub)
+        self.aggregates.add(sub)
+
+    def total_cost(self):
+        """Combined cost per month, whatever each subscription's billing period."""
+        return self.aggregates.monthly_total
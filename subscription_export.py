@@ -0,0 +1,222 @@
+"""Streaming export of subscriptions to CSV, JSON, JSON Lines and PDF.
+
+``export_subscriptions`` walks the subscriptions in chunks, writing each
+one to a temp file next to the target before moving on, so only a chunk
+of formatted output is held in memory at a time. ``cancelled`` is polled
+between chunks; a cancelled or failed export leaves no partial file.
+Only the PDF writer needs PyQt6, and it imports it when used.
+"""
+import csv
+import json
+from datetime import date
+
+from subscription_core import atomic_write
+
+
+EXPORT_CHUNK = 500
+
+# Format name -> file extension
+EXPORT_FORMATS = {
+    "CSV": ".csv",
+    "JSON": ".json",
+    "JSON Lines": ".jsonl",
+    "PDF": ".pdf",
+}
+
+# (heading, attribute, share of the PDF page width)
+COLUMNS = (
+    ("Name", "name", 0.30),
+    ("Renewal Date", "renewal_date", 0.16),
+    ("Cost", "cost", 0.11),
+    ("Currency", "currency", 0.10),
+    ("Billed", "frequency", 0.16),
+    ("Category", "category", 0.17),
+)
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def row_values(sub):
+    return [f"{sub.cost:.2f}" if field == "cost" else getattr(sub, field) for _, field, _ in COLUMNS]
+
+
+class CsvWriter:
+    def __init__(self, file):
+        self.writer = csv.writer(file)
+        self.writer.writerow([heading for heading, _, _ in COLUMNS])
+
+    def write(self, chunk):
+        self.writer.writerows(row_values(sub) for sub in chunk)
+
+    def finish(self):
+        pass
+
+
+class JsonWriter:
+    """Writes the same array-of-records layout as ``subscriptions.json``."""
+
+    def __init__(self, file):
+        self.file = file
+        self.separator = "\n    "
+        file.write("[")
+
+    def write(self, chunk):
+        for sub in chunk:
+            self.file.write(self.separator)
+            self.file.write(json.dumps(sub.to_dict()))
+            self.separator = ",\n    "
+
+    def finish(self):
+        self.file.write("\n]\n")
+
+
+class JsonLinesWriter:
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, chunk):
+        self.file.writelines(json.dumps(sub.to_dict()) + "\n" for sub in chunk)
+
+    def finish(self):
+        pass
+
+
+class PdfWriter:
+    """Paginated table of subscriptions drawn with ``QPdfWriter``.
+
+    Painting on a PDF device is allowed off the GUI thread, as long as a
+    QGuiApplication exists.
+    """
+    MARGIN_MM = 15
+
+    def __init__(self, path, title="Subscriptions"):
+        from PyQt6.QtCore import QMarginsF, Qt
+        from PyQt6.QtGui import QFont, QFontMetrics, QPageLayout, QPageSize, QPainter, QPdfWriter
+
+        self.writer = QPdfWriter(path)
+        self.writer.setTitle(title)
+        self.writer.setResolution(150)
+        self.writer.setPageSize(QPageSize(QPageSize.PageSizeId.A4))
+        margin = self.MARGIN_MM
+        self.writer.setPageMargins(QMarginsF(margin, margin, margin, margin), QPageLayout.Unit.Millimeter)
+        self.painter = QPainter(self.writer)
+        self.font = QFont("Helvetica", 9)
+        self.bold = QFont(self.font)
+        self.bold.setBold(True)
+        self.painter.setFont(self.font)
+        metrics = QFontMetrics(self.font, self.writer)
+        self.metrics = metrics
+        self.elide = Qt.TextElideMode.ElideRight
+        self.row_height = int(metrics.height() * 1.6)
+        self.width = self.writer.width()
+        self.bottom = self.writer.height() - self.row_height
+        self.columns = []
+        left = 0
+        for heading, _, share in COLUMNS:
+            width = int(self.width * share)
+            self.columns.append((left, width - metrics.averageCharWidth()))
+            left += width
+        self.page = 1
+        self.painter.setFont(self.bold)
+        self.painter.drawText(0, metrics.ascent(), f"{title} - {date.today().isoformat()}")
+        self.y = self.row_height * 2
+        self.draw_header()
+
+    def draw_row(self, values):
+        baseline = self.y + self.metrics.ascent()
+        for (left, width), value in zip(self.columns, values):
+            self.painter.drawText(left, baseline, self.metrics.elidedText(str(value), self.elide, width))
+        self.y += self.row_height
+
+    def draw_header(self):
+        self.painter.setFont(self.bold)
+        self.draw_row([heading for heading, _, _ in COLUMNS])
+        self.painter.drawLine(0, self.y - self.row_height // 4, self.width, self.y - self.row_height // 4)
+        self.painter.setFont(self.font)
+
+    def draw_footer(self):
+        self.painter.drawText(0, self.writer.height() - self.metrics.descent(), f"Page {self.page}")
+
+    def write(self, chunk):
+        for sub in chunk:
+            if self.y + self.row_height > self.bottom:
+                self.draw_footer()
+                self.writer.newPage()
+                self.page += 1
+                self.y = 0
+                self.draw_header()
+            self.draw_row(row_values(sub))
+
+    def finish(self):
+        self.draw_footer()
+        self.painter.end()
+
+    def abort(self):
+        if self.painter.isActive():
+            self.painter.end()
+
+
+TEXT_WRITERS = {
+    "CSV": CsvWriter,
+    "JSON": JsonWriter,
+    "JSON Lines": JsonLinesWriter,
+}
+
+
+def export_subscriptions(subs, path, fmt, matches=None, progress=None, cancelled=lambda: False,
+                         chunk_size=EXPORT_CHUNK):
+    """Write ``subs`` (those passing ``matches``, if given) to ``path`` as ``fmt``.
+
+    ``progress(done, total)`` is called after every chunk with the number
+    of subscriptions scanned so far. Returns the number exported; raises
+    ``ExportCancelled`` once ``cancelled()`` turns true.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    total = len(subs)
+    exported = 0
+
+    def write(temp_path):
+        nonlocal exported
+        if fmt == "PDF":
+            file = None
+            writer = PdfWriter(temp_path)
+        else:
+            file = open(temp_path, "w", encoding="utf-8", newline="")
+            writer = TEXT_WRITERS[fmt](file)
+        scanned = 0
+        try:
+            for chunk in chunked(subs, chunk_size):
+                if cancelled():
+                    raise ExportCancelled()
+                scanned += len(chunk)
+                if matches is not None:
+                    chunk = [sub for sub in chunk if matches(sub)]
+                writer.write(chunk)
+                exported += len(chunk)
+                if progress is not None:
+                    progress(scanned, total)
+            writer.finish()
+        except BaseException:
+            if file is None:
+                writer.abort()
+            raise
+        finally:
+            if file is not None:
+                file.close()
+
+    atomic_write(path, write)
+    return exported
@@ -0,0 +1,71 @@
+"""Spend forecasts over a horizon of whole calendar months.
+
+Every charge after a subscription's next renewal repeats every ``p``
+months. For each distinct period, first charges are binned into
+``(category, month)`` cells with one ``bincount``. The later charges are
+then a cumulative sum over columns spaced ``p`` apart, done as a reshape
+and ``cumsum``. Memory is O(subscriptions + categories * months), never
+one entry per charge.
+"""
+from datetime import date
+
+import numpy as np
+
+from subscription_recurrence import period_months
+
+_EPOCH = date(1970, 1, 1).toordinal()
+
+
+class Forecast:
+    """Read-only forecast result; every array is frozen after construction."""
+
+    __slots__ = ("start", "months", "categories", "by_category", "per_month", "cumulative", "cumulative_by_category")
+
+    def __init__(self, start, categories, by_category):
+        self.start = start
+        self.categories = tuple(categories)
+        self.by_category = by_category
+        self.per_month = by_category.sum(axis=0)
+        self.cumulative = np.cumsum(self.per_month)
+        self.cumulative_by_category = np.cumsum(by_category, axis=1)
+        self.months = start + np.arange(by_category.shape[1])
+        for array in (self.by_category, self.per_month, self.cumulative, self.cumulative_by_category, self.months):
+            array.setflags(write=False)
+
+    @property
+    def total(self):
+        return float(self.cumulative[-1]) if len(self.cumulative) else 0.0
+
+    def category_totals(self):
+        """``{category: total over the horizon}``, largest first."""
+        totals = self.cumulative_by_category[:, -1] if len(self.months) else np.zeros(len(self.categories))
+        order = np.argsort(-totals, kind="stable")
+        return {self.categories[i]: float(totals[i]) for i in order}
+
+
+def forecast(subs, months, today):
+    """Project every charge of ``subs`` over ``months`` calendar months starting with today's."""
+    subs = list(subs)
+    start = np.datetime64(date.fromordinal(today), "M")
+    categories = {}
+    codes = np.fromiter((categories.setdefault(sub.category, len(categories)) for sub in subs),
+                        dtype=np.int64, count=len(subs))
+    days = np.fromiter((sub.renewal_day for sub in subs), dtype=np.int64, count=len(subs))
+    amounts = np.fromiter((sub.cost for sub in subs), dtype=np.float64, count=len(subs))
+    periods = np.fromiter((period_months(sub.frequency) for sub in subs), dtype=np.int64, count=len(subs))
+
+    first = ((days - _EPOCH).astype("datetime64[D]").astype("datetime64[M]") - start).astype(np.int64)
+    # A renewal date already in the past still charges this month
+    first = np.maximum(first, 0)
+    width = len(categories)
+    by_category = np.zeros((width, months))
+    inside = first < months
+    for period in np.unique(periods[inside]):
+        selected = inside & (periods == period)
+        padded = -(-months // period) * period
+        cells = np.bincount(codes[selected] * padded + first[selected], weights=amounts[selected],
+                            minlength=width * padded)
+        # Column b then holds every charge landing in b: the first charges at b, b - p, b - 2p, ...
+        steps = cells.reshape(width, padded // period, period).cumsum(axis=1)
+        by_category += steps.reshape(width, padded)[:, :months]
+    return Forecast(start, categories, by_category)
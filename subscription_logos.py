@@ -0,0 +1,118 @@
+"""Packed atlas of pre-scaled logos.
+
+``python subscription_logos.py`` packs every image in ``logos/`` into
+``logos.atlas`` at the sizes the UI draws (card logos and list icons).
+At runtime the atlas is memory-mapped once, and a logo lookup is a dict
+hit giving an offset into the mapped pixels, with no file probing or PNG
+decoding. Layout (little-endian)::
+
+    header      magic, version, index length, CRC-32 of everything after it
+    index       UTF-8 JSON: {file name: {size: [offset, width, height]}}
+    pixels      ARGB32 premultiplied rows, offsets relative to this section
+
+Logos missing from the atlas resolve to the default logo's entry. Nothing
+here imports PyQt6 except the build step.
+"""
+import json
+import struct
+import zlib
+from pathlib import Path
+
+from subscription_core import LOGO_DIR, DEFAULT_ICON, atomic_write, open_mapped, write_bytes
+
+
+ATLAS_FILE = "logos.atlas"
+# CARD_LOGO_SIZE and LIST_ICON_SIZE in subscription.py
+ATLAS_SIZES = (48, 16)
+
+MAGIC = b"LOGOATL1"
+VERSION = 1
+_HEADER = struct.Struct("<8sIII4x")
+_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".svg", ".webp"}
+
+
+def atlas_key(path):
+    """Return the atlas key for a logo path, or None if it lies outside ``LOGO_DIR``."""
+    path = Path(path)
+    return path.name if path.parent == LOGO_DIR else None
+
+
+def build_atlas(logo_dir=LOGO_DIR, path=ATLAS_FILE, sizes=ATLAS_SIZES):
+    """Decode, scale and pack every image in ``logo_dir``; return the number packed."""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QImage
+
+    index = {}
+    pixels = bytearray()
+    for source in sorted(Path(logo_dir).iterdir()):
+        if source.suffix.lower() not in _IMAGE_SUFFIXES:
+            continue
+        image = QImage(str(source))
+        if image.isNull():
+            continue
+        entry = index[source.name] = {}
+        for size in sizes:
+            scaled = image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                  Qt.TransformationMode.SmoothTransformation)
+            scaled = scaled.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+            entry[str(size)] = [len(pixels), scaled.width(), scaled.height()]
+            bits = scaled.constBits()
+            bits.setsize(scaled.sizeInBytes())
+            pixels += bytes(bits)
+
+    encoded = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    encoded += b" " * (-len(encoded) % 8)
+    body = encoded + pixels
+    header = _HEADER.pack(MAGIC, VERSION, len(encoded), zlib.crc32(body))
+    atomic_write(path, write_bytes, header, body)
+    return len(index)
+
+
+class LogoAtlas:
+    """Read-only view of a memory-mapped atlas.
+
+    Use ``LogoAtlas.open``, which returns None when the atlas is missing or
+    corrupt; callers then fall back to decoding the loose files.
+    """
+
+    def __init__(self, file, mapped):
+        self.file = file
+        self.mapped = mapped
+        self.view = memoryview(mapped)
+        _, _, index_length, _ = _HEADER.unpack_from(self.view)
+        start = _HEADER.size
+        self.index = {
+            name: {int(size): tuple(entry) for size, entry in sizes.items()}
+            for name, sizes in json.loads(str(self.view[start:start + index_length], "utf-8")).items()
+        }
+        self.pixels = self.view[start + index_length:]
+        self.default = self.index.get(atlas_key(DEFAULT_ICON), {})
+
+    @classmethod
+    def open(cls, path=ATLAS_FILE):
+        opened = open_mapped(path, _HEADER, MAGIC, VERSION, lambda fields, size: fields[2] <= size)
+        return cls(*opened) if opened else None
+
+    def covers(self, path, size):
+        """True if lookups for ``path`` at ``size`` are answered by the atlas."""
+        return size in self.default and atlas_key(path) is not None
+
+    def lookup(self, path, size):
+        """Return ``(pixels, width, height)`` for a logo, or None if the atlas can't answer.
+
+        ``pixels`` is a memoryview of ARGB32 premultiplied rows straight out
+        of the mapping. Names the atlas doesn't know get the default logo.
+        """
+        key = atlas_key(path)
+        if key is None:
+            return None
+        entry = self.index.get(key, self.default).get(size) or self.default.get(size)
+        if entry is None:
+            return None
+        offset, width, height = entry
+        return self.pixels[offset:offset + width * height * 4], width, height
+
+
+if __name__ == "__main__":
+    count = build_atlas()
+    print(f"Packed {count} logos at {', '.join(map(str, ATLAS_SIZES))}px into {ATLAS_FILE}")
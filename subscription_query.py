@@ -0,0 +1,190 @@
+"""Structured filter queries such as ``cost>10 category:Streaming due<7d``.
+
+A query is parsed once into terms. ``Query.evaluate`` runs the terms
+against a ``SubscriptionStore``. Cost and renewal terms become range
+scans on the store's sort indexes, and the most selective range supplies
+the candidates. Bare words go through the text search index, and the
+remaining terms are checked per candidate. ``Query.predicate`` gives the
+same filter as a plain function for code that has no store, such as
+exports.
+
+Supported terms::
+
+    cost>10  cost<=5.50  cost=9.99     cost per billing period
+    due<7d   due>=2w     due<1m        days until renewal (d, w, m, y)
+    renewal>=2025-01-01                renewal date
+    category:Streaming  currency:EUR  frequency:Annually   exact, any case
+    name:prime                          substring of the name
+    netflix  "amazon prime"             free text over name and category
+"""
+import re
+import shlex
+from datetime import date
+
+from subscription_core import today_ordinal
+from subscription_search import fuzzy_score, search_text
+
+
+class QueryError(ValueError):
+    pass
+
+
+_TERM = re.compile(r"^([A-Za-z]+)(<=|>=|<|>|=|:)(.*)$")
+_DURATION = re.compile(r"^(-?\d+)([dwmy]?)$")
+_DURATION_DAYS = {"": 1, "d": 1, "w": 7, "m": 30, "y": 365}
+
+NUMERIC_FIELDS = ("cost", "due", "renewal")
+TEXT_FIELDS = ("category", "currency", "frequency", "name")
+
+
+def _parse_value(field, text):
+    try:
+        if field == "cost":
+            return float(text.replace("$", ""))
+        if field == "due":
+            match = _DURATION.match(text.lower())
+            if not match:
+                raise ValueError(text)
+            return int(match.group(1)) * _DURATION_DAYS[match.group(2)]
+        if field == "renewal":
+            return date.fromisoformat(text).toordinal()
+    except ValueError:
+        raise QueryError(f"Invalid value for {field}: {text}")
+    return text.lower()
+
+
+class Term:
+    __slots__ = ("field", "op", "value")
+
+    def __init__(self, field, op, value):
+        self.field = field
+        self.op = "=" if op == ":" else op
+        self.value = value
+
+    def bounds(self, today):
+        """``(index field, low, high, include_low, include_high)`` for range terms."""
+        if self.field == "cost":
+            index, value = "cost", self.value
+        else:
+            # due<7d is a bound on the renewal day relative to today
+            index, value = "renewal", self.value + (today if self.field == "due" else 0)
+        if self.op == "=":
+            return index, value, value, True, True
+        if self.op in ("<", "<="):
+            return index, None, value, True, self.op == "<="
+        return index, value, None, self.op == ">=", True
+
+    def compile(self, today):
+        field, value = self.field, self.value
+        if field in TEXT_FIELDS:
+            if field == "name":
+                return lambda sub: value in sub.name.lower()
+            return lambda sub: getattr(sub, field).lower() == value
+        _, low, high, include_low, include_high = self.bounds(today)
+        get = (lambda sub: sub.cost) if field == "cost" else (lambda sub: sub.renewal_day)
+        if low is None:
+            return (lambda sub: get(sub) <= high) if include_high else (lambda sub: get(sub) < high)
+        if high is None:
+            return (lambda sub: get(sub) >= low) if include_low else (lambda sub: get(sub) > low)
+        return lambda sub: low <= get(sub) <= high
+
+
+class Query:
+    def __init__(self, text, terms, words):
+        self.text = text
+        self.terms = terms
+        self.words = words
+
+    def __bool__(self):
+        return bool(self.terms or self.words)
+
+    def predicate(self, today=None):
+        today = today_ordinal() if today is None else today
+        checks = [term.compile(today) for term in self.terms]
+        words = self.words
+
+        def matches(sub):
+            if words:
+                text = f"{sub.name.lower()}\0{sub.category.lower()}"
+                if not all(word in text for word in words):
+                    return False
+            return all(check(sub) for check in checks)
+        return matches
+
+    def evaluate(self, store, today=None, fuzzy=False):
+        """Return the matching subscriptions as a set, or ``{sub: score}`` when fuzzy."""
+        today = today_ordinal() if today is None else today
+        scores = None
+        if fuzzy and self.words:
+            scores = store.search.search_fuzzy(" ".join(self.words))
+            candidates = scores
+        elif self.words:
+            candidates = None
+            for word in self.words:
+                found = store.search.search(word)
+                candidates = found if candidates is None else candidates & found
+        else:
+            candidates = None
+
+        remaining = [term for term in self.terms if term.field in TEXT_FIELDS]
+        ranges = []
+        for term in self.terms:
+            if term.field in NUMERIC_FIELDS:
+                field, *bounds = term.bounds(today)
+                index = store.sorted_by(field)
+                start, stop = index.range_bounds(*bounds)
+                ranges.append((stop - start, index, start, stop, term))
+        if ranges:
+            ranges.sort(key=lambda item: item[0])
+            size, index, start, stop, term = ranges[0]
+            if candidates is None or size < len(candidates):
+                in_range = index.slice(start, stop)
+                candidates = in_range if candidates is None else [sub for sub in in_range if sub in candidates]
+            else:
+                remaining.append(term)
+            remaining.extend(item[4] for item in ranges[1:])
+        if candidates is None:
+            candidates = store
+
+        checks = [term.compile(today) for term in remaining]
+        if scores is not None:
+            return {sub: scores[sub] for sub in candidates if all(check(sub) for check in checks)}
+        return {sub for sub in candidates if all(check(sub) for check in checks)}
+
+    def match(self, subs, today=None, fuzzy=False):
+        """Like ``evaluate``, but over a few subscriptions that are not in a store yet."""
+        if not (fuzzy and self.words):
+            matches = self.predicate(today)
+            return {sub for sub in subs if matches(sub)}
+        today = today_ordinal() if today is None else today
+        checks = [term.compile(today) for term in self.terms]
+        query = " ".join(self.words).lower()
+        scores = {}
+        for sub in subs:
+            score = fuzzy_score(query, search_text(sub))
+            if score is not None and all(check(sub) for check in checks):
+                scores[sub] = score
+        return scores
+
+
+def parse_query(text):
+    try:
+        tokens = shlex.split(text)
+    except ValueError as e:
+        raise QueryError(str(e))
+    terms = []
+    words = []
+    for token in tokens:
+        match = _TERM.match(token)
+        if match is None:
+            words.append(token.lower())
+            continue
+        field, op, value = match.group(1).lower(), match.group(2), match.group(3)
+        if field not in NUMERIC_FIELDS and field not in TEXT_FIELDS:
+            raise QueryError(f"Unknown field: {field}")
+        if not value:
+            raise QueryError(f"Missing value for {field}")
+        if field in TEXT_FIELDS and op not in (":", "="):
+            raise QueryError(f"{field} only supports ':'")
+        terms.append(Term(field, op, _parse_value(field, value)))
+    return Query(text, terms, words)
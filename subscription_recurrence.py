@@ -0,0 +1,77 @@
+"""Billing periods: renewal roll-forward and cost normalisation.
+
+Both work on whole arrays at once. Ordinal days become ``datetime64``
+months plus a day-of-month, so a collection of any size is rolled forward
+with a handful of NumPy operations. Days past the end of a shorter month
+are clamped to its last day (31 January renews on 28 February).
+"""
+from datetime import date
+
+import numpy as np
+
+
+FREQUENCY_MONTHS = {
+    "Monthly": 1,
+    "Quarterly": 3,
+    "Semi-Annually": 6,
+    "Annually": 12
+}
+BILLING_FREQUENCIES = list(FREQUENCY_MONTHS)
+
+PERIOD_LABELS = {
+    "Monthly": "month",
+    "Quarterly": "quarter",
+    "Semi-Annually": "6 months",
+    "Annually": "year"
+}
+
+_EPOCH = date(1970, 1, 1).toordinal()
+
+
+def period_months(frequency):
+    return FREQUENCY_MONTHS.get(frequency, 1)
+
+
+def period_label(frequency):
+    return PERIOD_LABELS.get(frequency, "month")
+
+
+def _add_months(month_starts, months, day_of_month):
+    target = month_starts + months.astype("timedelta64[M]")
+    first_day = target.astype("datetime64[D]")
+    month_length = ((target + 1).astype("datetime64[D]") - first_day).astype(np.int64)
+    return (first_day + np.minimum(day_of_month, month_length - 1)).astype(np.int64) + _EPOCH
+
+
+def roll_forward_days(days, months, today):
+    """Next renewal on or after ``today`` for arrays of ordinal days and period lengths."""
+    days = np.asarray(days, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    dates = (days - _EPOCH).astype("datetime64[D]")
+    month_starts = dates.astype("datetime64[M]")
+    day_of_month = (dates - month_starts.astype("datetime64[D]")).astype(np.int64)
+    elapsed = (np.datetime64(date.fromordinal(today), "M") - month_starts).astype(np.int64)
+    # Whole periods up to today's month; one more if that still lands before today
+    periods = np.maximum(elapsed // months, 0)
+    rolled = _add_months(month_starts, periods * months, day_of_month)
+    behind = rolled < today
+    if behind.any():
+        rolled[behind] = _add_months(month_starts[behind], (periods[behind] + 1) * months[behind], day_of_month[behind])
+    return np.where(days < today, rolled, days)
+
+
+def roll_forward(subs, today):
+    """Return ``[(sub, new renewal day)]`` for the subscriptions whose renewal has passed."""
+    overdue = [sub for sub in subs if sub.renewal_day < today]
+    if not overdue:
+        return []
+    rolled = roll_forward_days([sub.renewal_day for sub in overdue],
+                               [period_months(sub.frequency) for sub in overdue], today)
+    return list(zip(overdue, rolled.tolist()))
+
+
+def normalized_costs(subs, months=1):
+    """Array of each subscription's cost expressed per ``months``-month period."""
+    costs = np.fromiter((sub.cost for sub in subs), dtype=np.float64)
+    periods = np.fromiter((period_months(sub.frequency) for sub in subs), dtype=np.float64, count=len(costs))
+    return costs * (months / periods)
@@ -0,0 +1,106 @@
+"""Renewal reminders driven by a min-heap of reminder instants.
+
+Each subscription is reminded once, at local midnight ``lead_days``
+before it renews. The heap holds ``(instant, seq, sub)`` entries.
+Rescheduling or removing a subscription only drops it from
+``_scheduled``, and the stale heap entry is skipped when it surfaces, so
+every change costs O(log n). The GUI arms a single timer for
+``next_due()``.
+"""
+import heapq
+from datetime import date, datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def day_start(day):
+    """Unix timestamp of local midnight at the start of ordinal ``day``."""
+    return datetime.combine(date.fromordinal(day), datetime.min.time()).timestamp()
+
+
+class RenewalScheduler:
+    def __init__(self, lead_days=7):
+        self.lead_days = lead_days
+        self._heap = []
+        self._scheduled = {}
+        self._reminded = {}
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._scheduled)
+
+    def reminder_day(self, sub):
+        return sub.renewal_day - self.lead_days
+
+    def _entry(self, sub, day):
+        self._seq += 1
+        self._scheduled[sub] = (day, self._seq)
+        return day_start(day), self._seq, sub
+
+    def schedule(self, sub):
+        """Schedule ``sub`` for its current renewal date, unless already reminded of it."""
+        day = self.reminder_day(sub)
+        if self._reminded.get(sub) == day or self._scheduled.get(sub, (None,))[0] == day:
+            return
+        heapq.heappush(self._heap, self._entry(sub, day))
+        self._compact()
+
+    def extend(self, subs):
+        heap = self._heap
+        entries = [self._entry(sub, day) for sub, day in ((sub, self.reminder_day(sub)) for sub in subs)
+                   if self._reminded.get(sub) != day]
+        # k pushes cost k log n; re-heapifying costs n, so only do that for big batches
+        if len(entries) * max(len(heap), 1).bit_length() < len(heap):
+            for entry in entries:
+                heapq.heappush(heap, entry)
+        else:
+            heap.extend(entries)
+            heapq.heapify(heap)
+
+    def unschedule(self, sub):
+        self._scheduled.pop(sub, None)
+
+    def forget(self, sub):
+        self._scheduled.pop(sub, None)
+        self._reminded.pop(sub, None)
+
+    def set_lead_days(self, lead_days, subs):
+        self.lead_days = lead_days
+        self._heap = []
+        self._scheduled = {}
+        self.extend(subs)
+
+    def _valid(self, entry):
+        return self._scheduled.get(entry[2], (None, None))[1] == entry[1]
+
+    def _compact(self):
+        # Stale entries are normally skipped lazily; rebuild once they dominate
+        if len(self._heap) > 2 * len(self._scheduled) + 64:
+            self._heap = [entry for entry in self._heap if self._valid(entry)]
+            heapq.heapify(self._heap)
+
+    def next_due(self):
+        """Instant of the earliest pending reminder, or None."""
+        heap = self._heap
+        while heap and not self._valid(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, now):
+        """Remove and return the subscriptions whose reminder instant has passed.
+
+        Subscriptions that already renewed before ``now`` are dropped without
+        being returned.
+        """
+        today = date.fromtimestamp(now).toordinal()
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if not self._valid(entry):
+                continue
+            sub = entry[2]
+            self._reminded[sub] = self._scheduled.pop(sub)[0]
+            if sub.renewal_day >= today:
+                due.append(sub)
+        return due
@@ -0,0 +1,109 @@
+"""Text search over subscription names and categories.
+
+``SearchIndex`` keeps a trigram posting list per subscription so a query
+only has to verify the few records sharing its rarest trigrams. Typing
+extends the previous query, and the previous result is then narrowed
+instead of searched again. Fuzzy matching is a ranked subsequence match.
+"""
+
+
+def search_text(sub):
+    # NUL keeps trigrams from spanning the name and the category
+    return f"{sub.name.lower()}\0{sub.category.lower()}"
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def fuzzy_score(query, text):
+    """Score ``query`` as an in-order subsequence of ``text``; None if it is not one.
+
+    Consecutive characters and matches at word starts score higher, skipped
+    characters cost a little, and a plain substring match wins outright.
+    """
+    score = 0
+    position = 0
+    previous = -2
+    for char in query:
+        found = text.find(char, position)
+        if found < 0:
+            return None
+        if found == previous + 1:
+            score += 3
+        if found == 0 or not text[found - 1].isalnum():
+            score += 2
+        score -= min(found - position, 3)
+        previous = found
+        position = found + 1
+    if query in text:
+        score += 10
+    return score
+
+
+class SearchIndex:
+    def __init__(self):
+        self._text = {}
+        self._postings = {}
+        self._last_query = None
+        self._last_results = None
+        self._last_fuzzy = False
+
+    def __len__(self):
+        return len(self._text)
+
+    def add(self, sub):
+        text = self._text[sub] = search_text(sub)
+        for gram in trigrams(text):
+            self._postings.setdefault(gram, set()).add(sub)
+        self._last_query = None
+
+    def extend(self, subs):
+        for sub in subs:
+            self.add(sub)
+
+    def remove(self, sub):
+        text = self._text.pop(sub)
+        for gram in trigrams(text):
+            posting = self._postings[gram]
+            posting.discard(sub)
+            if not posting:
+                del self._postings[gram]
+        self._last_query = None
+
+    def _candidates(self, query, fuzzy):
+        if (self._last_query is not None and fuzzy == self._last_fuzzy
+                and (query.startswith(self._last_query) if fuzzy else self._last_query in query)):
+            # Anything matching the longer query also matched the shorter one
+            return self._last_results
+        if fuzzy or len(query) < 3:
+            return self._text
+        postings = sorted((self._postings.get(gram, ()) for gram in trigrams(query)), key=len)
+        if not postings[0]:
+            return ()
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, query):
+        """Return the set of subscriptions whose name or category contains ``query``."""
+        query = query.lower()
+        text = self._text
+        results = {sub for sub in self._candidates(query, False) if query in text[sub]}
+        self._last_query, self._last_results, self._last_fuzzy = query, results, False
+        return results
+
+    def search_fuzzy(self, query):
+        """Return ``{sub: score}`` for fuzzy matches; higher scores rank first."""
+        query = query.lower()
+        text = self._text
+        results = {}
+        for sub in self._candidates(query, True):
+            score = fuzzy_score(query, text[sub])
+            if score is not None:
+                results[sub] = score
+        self._last_query, self._last_results, self._last_fuzzy = query, results, True
+        return results
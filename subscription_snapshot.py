@@ -0,0 +1,143 @@
+"""Binary snapshot of the subscription collection for fast cold starts.
+
+The snapshot sits next to ``subscriptions.json`` and records the size and
+modification time of the JSON file it was built from; if the JSON source
+changes it is ignored and rebuilt on the next load. Layout (little-endian,
+every section 8-byte aligned)::
+
+    header      magic, version, record count, string count,
+                source mtime_ns, source size, CRC-32 of everything after it
+    costs       float64[count]
+    added       float64[count]      Unix timestamps of when records were added
+    days        int32[count]        ordinal renewal days
+    refs        uint32[count * 6]   string ids for each text field
+    offsets     uint32[strings + 1] byte offsets into the string blob
+    blob        UTF-8 text of the deduplicated string table
+
+The file is memory-mapped on load, so records are read straight out of
+the packed arrays without any text parsing.
+"""
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from subscription_core import Subscription, atomic_write, open_mapped, write_bytes
+
+
+SNAPSHOT_FILE = "subscriptions.snap"
+
+MAGIC = b"SUBSNAP1"
+VERSION = 2
+_HEADER = struct.Struct("<8sIIIqqI4x")
+_STRING_FIELDS = ("name", "color", "logo", "category", "currency", "frequency")
+
+
+def _pad(length):
+    return -length % 8
+
+
+def source_signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_snapshot(path, subs, signature):
+    """Write ``subs`` as a snapshot of the JSON source identified by ``signature``."""
+    if sys.byteorder != "little":
+        return
+    string_ids = {}
+    costs = array("d")
+    added = array("d")
+    days = array("i")
+    refs = array("I")
+    for sub in subs:
+        costs.append(sub.cost)
+        added.append(sub.added)
+        days.append(sub.renewal_day)
+        for field in _STRING_FIELDS:
+            text = getattr(sub, field)
+            string_id = string_ids.get(text)
+            if string_id is None:
+                string_id = string_ids[text] = len(string_ids)
+            refs.append(string_id)
+
+    encoded = [text.encode("utf-8") for text in string_ids]
+    offsets = array("I", [0])
+    for chunk in encoded:
+        offsets.append(offsets[-1] + len(chunk))
+
+    body = bytearray()
+    for section in (costs.tobytes(), added.tobytes(), days.tobytes(), refs.tobytes(), offsets.tobytes(), b"".join(encoded)):
+        body += section
+        body += bytes(_pad(len(section)))
+
+    header = _HEADER.pack(MAGIC, VERSION, len(costs), len(encoded), signature[0], signature[1], zlib.crc32(body))
+    atomic_write(path, write_bytes, header, body)
+
+
+class SnapshotReader:
+    """Reads subscriptions out of a memory-mapped snapshot.
+
+    Use ``SnapshotReader.open``, which returns None when the snapshot is
+    missing, corrupt or older than its JSON source.
+    """
+
+    def __init__(self, file, mapped):
+        self.file = file
+        self.mapped = mapped
+        self.view = memoryview(mapped)
+        magic, version, self.count, string_count, _, _, _ = _HEADER.unpack_from(self.view)
+        offset = _HEADER.size
+        sections = []
+        for typecode, length in (("d", self.count), ("d", self.count), ("i", self.count),
+                                 ("I", self.count * len(_STRING_FIELDS)), ("I", string_count + 1)):
+            size = length * array(typecode).itemsize
+            sections.append(self.view[offset:offset + size].cast(typecode))
+            offset += size + _pad(size)
+        self.costs, self.added, self.days, self.refs, self.offsets = sections
+        self.blob = self.view[offset:offset + self.offsets[string_count]]
+        self.strings = [None] * string_count
+        self.read = 0
+
+    @classmethod
+    def open(cls, path, source_path):
+        try:
+            signature = source_signature(source_path)
+        except OSError:
+            return None
+        opened = open_mapped(path, _HEADER, MAGIC, VERSION, lambda fields, size: fields[4:6] == signature)
+        return cls(*opened) if opened else None
+
+    def string(self, string_id):
+        text = self.strings[string_id]
+        if text is None:
+            start, end = self.offsets[string_id], self.offsets[string_id + 1]
+            text = self.strings[string_id] = str(self.blob[start:end], "utf-8")
+        return text
+
+    def __iter__(self):
+        string = self.string
+        refs = self.refs
+        width = len(_STRING_FIELDS)
+        for row in range(self.count):
+            base = row * width
+            self.read = row + 1
+            yield Subscription(
+                string(refs[base]), self.days[row], self.costs[row], string(refs[base + 1]),
+                string(refs[base + 2]), string(refs[base + 3]), string(refs[base + 4]), string(refs[base + 5]),
+                self.added[row]
+            )
+
+    def progress(self):
+        return int(self.read * 100 / max(self.count, 1))
+
+    def close(self):
+        if self.view is None:
+            return
+        for view in (self.costs, self.added, self.days, self.refs, self.offsets, self.blob, self.view):
+            view.release()
+        self.view = None
+        self.mapped.close()
+        self.file.close()
@@ -0,0 +1,323 @@
+"""Storage backends for the subscription store.
+
+Both backends expose the same entry points: ``exists``, ``open_reader``
+for streaming a saved collection back in and ``save`` for a full rewrite.
+Backends with ``incremental`` set also take ``apply`` for a batch of
+single-record writes. The JSON backend has none, so callers fall back to
+``save`` after each mutation.
+
+``WriteBehindWriter`` runs those writes on a background thread.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from subscription_core import DATA_FILE, Subscription, atomic_write, iter_subscriptions, write_json
+from subscription_snapshot import SNAPSHOT_FILE, SnapshotReader, source_signature, write_snapshot
+
+
+DB_FILE = "subscriptions.db"
+
+STORAGE_BACKENDS = ["JSON", "SQLite"]
+
+_COLUMNS = ("name", "renewal_day", "cost", "color", "logo", "category", "currency", "frequency", "added")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscriptions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    renewal_day INTEGER NOT NULL,
+    cost REAL NOT NULL,
+    color TEXT NOT NULL,
+    logo TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    currency TEXT NOT NULL DEFAULT 'USD',
+    frequency TEXT NOT NULL DEFAULT 'Monthly',
+    added REAL NOT NULL DEFAULT 0
+);
+-- Queries run on the in-memory SortedIndex and SearchIndex, so secondary
+-- indexes here would only slow writes; drop those older databases have
+DROP INDEX IF EXISTS idx_subscriptions_name;
+DROP INDEX IF EXISTS idx_subscriptions_renewal;
+DROP INDEX IF EXISTS idx_subscriptions_category;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class JsonReader:
+    def __init__(self, path, snapshot_path=None):
+        self.signature = source_signature(path)
+        self.size = self.signature[1]
+        self.file = open(path, "r")
+        self.snapshot_path = snapshot_path
+
+    def __iter__(self):
+        loaded = [] if self.snapshot_path else None
+        for sub in iter_subscriptions(self.file):
+            if loaded is not None:
+                loaded.append(sub)
+            yield sub
+        if loaded is not None:
+            try:
+                write_snapshot(self.snapshot_path, loaded, self.signature)
+            except OSError:
+                # The snapshot is only a cache; the next load simply parses the JSON again
+                pass
+
+    def progress(self):
+        if self.file.closed:
+            return 100
+        return int(self.file.tell() * 100 / max(self.size, 1))
+
+    def close(self):
+        self.file.close()
+
+
+class JsonBackend:
+    """JSON storage, optionally mirrored by a binary snapshot for fast loads."""
+    incremental = False
+
+    def __init__(self, path=DATA_FILE, snapshot_path=None):
+        self.path = path
+        self.snapshot_path = snapshot_path
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def open_reader(self):
+        if self.snapshot_path:
+            reader = SnapshotReader.open(self.snapshot_path, self.path)
+            if reader is not None:
+                return reader
+        return JsonReader(self.path, self.snapshot_path)
+
+    def save(self, subs):
+        atomic_write(self.path, write_json, subs)
+        if self.snapshot_path:
+            try:
+                write_snapshot(self.snapshot_path, subs, source_signature(self.path))
+            except OSError:
+                pass
+
+    def close(self):
+        pass
+
+
+def _row_to_subscription(row):
+    sub = Subscription(*row[1:])
+    sub.id = row[0]
+    return sub
+
+
+def _subscription_params(sub):
+    return tuple(getattr(sub, column) for column in _COLUMNS)
+
+
+class SqliteReader:
+    def __init__(self, path, batch_size=500):
+        # A separate connection reads from a stable WAL snapshot while the
+        # backend connection keeps accepting writes
+        self.connection = sqlite3.connect(path)
+        self.total = self.connection.execute("SELECT COUNT(*) FROM subscriptions").fetchone()[0]
+        self.batch_size = batch_size
+        self.read = 0
+
+    def __iter__(self):
+        cursor = self.connection.execute(
+            f"SELECT id, {', '.join(_COLUMNS)} FROM subscriptions ORDER BY id"
+        )
+        while True:
+            rows = cursor.fetchmany(self.batch_size)
+            if not rows:
+                return
+            for row in rows:
+                self.read += 1
+                yield _row_to_subscription(row)
+
+    def progress(self):
+        return int(self.read * 100 / max(self.total, 1))
+
+    def close(self):
+        self.connection.close()
+
+
+class SqliteBackend:
+    """SQLite storage in WAL mode, written one row at a time through ``apply``.
+
+    On first use the existing JSON file, if any, is imported once.
+    """
+    incremental = True
+
+    def __init__(self, path=DB_FILE, json_path=DATA_FILE):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(subscriptions)")}
+        if "added" not in columns:
+            self.connection.execute("ALTER TABLE subscriptions ADD COLUMN added REAL NOT NULL DEFAULT 0")
+        self.migrate_json(json_path)
+
+    def exists(self):
+        return True
+
+    def migrate_json(self, json_path):
+        if self._meta("json_migrated") or not os.path.exists(json_path):
+            return
+        with open(json_path, "r") as file, self.connection:
+            self.connection.executemany(
+                f"INSERT INTO subscriptions ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                (_subscription_params(sub) for sub in iter_subscriptions(file))
+            )
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)", (json_path,))
+
+    def _meta(self, key):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def open_reader(self):
+        return SqliteReader(self.path)
+
+    def save(self, subs):
+        with self.connection:
+            self.connection.execute("DELETE FROM subscriptions")
+            for sub in subs:
+                sub.id = None
+                self._insert(sub)
+
+    def apply(self, changes):
+        """Apply a batch of ``(op, sub)`` changes in a single transaction."""
+        with self.connection:
+            for op, sub in changes:
+                if op == "add" or (op == "update" and sub.id is None):
+                    self._insert(sub)
+                elif op == "update":
+                    self._update(sub)
+                elif op == "remove" and sub.id is not None:
+                    self.connection.execute("DELETE FROM subscriptions WHERE id = ?", (sub.id,))
+                    sub.id = None
+
+    def _insert(self, sub):
+        cursor = self.connection.execute(
+            f"INSERT INTO subscriptions ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+            _subscription_params(sub)
+        )
+        sub.id = cursor.lastrowid
+
+    def _update(self, sub):
+        self.connection.execute(
+            f"UPDATE subscriptions SET {', '.join(column + ' = ?' for column in _COLUMNS)} WHERE id = ?",
+            _subscription_params(sub) + (sub.id,)
+        )
+
+    def close(self):
+        self.connection.close()
+
+
+def create_backend(name, snapshot=True):
+    if name == "SQLite":
+        return SqliteBackend()
+    return JsonBackend(snapshot_path=SNAPSHOT_FILE if snapshot else None)
+
+
+class WriteBehindWriter:
+    """Background writer that coalesces saves for a storage backend.
+
+    Mutations only record what is dirty; the thread waits ``delay`` seconds
+    from the first dirty mark, then performs one write for everything
+    gathered so far. A burst of edits therefore costs a single write.
+    ``flush`` blocks until everything recorded has been written.
+    """
+
+    def __init__(self, backend, delay=0.5, on_error=None):
+        self.backend = backend
+        self.delay = delay
+        self.on_error = on_error
+        self._condition = threading.Condition()
+        self._snapshot = None
+        self._changes = {}
+        self._dirty_at = None
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="subscription-writer", daemon=True)
+        self._thread.start()
+
+    def save_all(self, subs):
+        """Schedule a full rewrite; supersedes any pending per-record changes."""
+        with self._condition:
+            self._snapshot = list(subs)
+            self._changes.clear()
+            self._mark_dirty()
+
+    def record_change(self, op, sub):
+        """Schedule an ``add``, ``update`` or ``remove`` of a single record."""
+        with self._condition:
+            key = id(sub)
+            previous = self._changes.get(key)
+            if previous is not None and previous[0] == "add":
+                if op == "remove":
+                    # Added and removed within one window: nothing to write
+                    del self._changes[key]
+                    return
+                op = "add"
+            self._changes[key] = (op, sub)
+            self._mark_dirty()
+
+    def flush(self):
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._has_work() or self._writing:
+                self._condition.wait()
+            self._flush_requested = False
+
+    def close(self):
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _has_work(self):
+        return self._snapshot is not None or bool(self._changes)
+
+    def _mark_dirty(self):
+        if self._dirty_at is None:
+            self._dirty_at = time.monotonic()
+        self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._has_work() and not self._closed:
+                    self._condition.wait()
+                if not self._has_work():
+                    return
+                while not (self._flush_requested or self._closed):
+                    remaining = self._dirty_at + self.delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                snapshot, changes = self._snapshot, list(self._changes.values())
+                self._snapshot = None
+                self._changes = {}
+                self._dirty_at = None
+                self._writing = True
+            try:
+                if snapshot is not None:
+                    self.backend.save(snapshot)
+                if changes:
+                    self.backend.apply(changes)
+            except Exception as e:
+                if self.on_error is not None:
+                    self.on_error(e)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()